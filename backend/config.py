@@ -4,32 +4,44 @@ Loads settings from .env file.
 """
 
 import os
-from dotenv import load_dotenv
 from pathlib import Path
 
 # Load environment variables
 env_path = Path(__file__).parent.parent / ".env"
-load_dotenv(env_path)
+
+
+def _load_env() -> dict:
+    """Parse .env and merge it with the process environment (process wins)."""
+    if not env_path.exists():
+        return dict(os.environ)
+    from dotenv import dotenv_values
+    dotenv = {k: v for k, v in dotenv_values(env_path).items() if v is not None}
+    return {**dotenv, **os.environ}
+
+
+# Parsed once at import; every setting below reads from this snapshot
+_ENV = _load_env()
 
 # Gmail Configuration
-GMAIL_ADDRESS = os.getenv("GMAIL_ADDRESS", "")
-GMAIL_APP_PASSWORD = os.getenv("GMAIL_APP_PASSWORD", "")
+GMAIL_ADDRESS = _ENV.get("GMAIL_ADDRESS", "")
+GMAIL_APP_PASSWORD = _ENV.get("GMAIL_APP_PASSWORD", "")
 
 # SMTP Verifier Configuration
-VERIFIER_DELAY_SECONDS = float(os.getenv("VERIFIER_DELAY_SECONDS", "1.5"))
-VERIFIER_FROM_EMAIL = os.getenv("VERIFIER_FROM_EMAIL", "verify@example.com")
+VERIFIER_DELAY_SECONDS = float(_ENV.get("VERIFIER_DELAY_SECONDS", "1.5"))
+VERIFIER_FROM_EMAIL = _ENV.get("VERIFIER_FROM_EMAIL", "verify@example.com")
+VERIFIER_CONCURRENCY = int(_ENV.get("VERIFIER_CONCURRENCY", "5"))
 
 # Rate Limits
-EMAILS_PER_MINUTE = int(os.getenv("EMAILS_PER_MINUTE", "5"))
-DAILY_EMAIL_CAP = int(os.getenv("DAILY_EMAIL_CAP", "50"))
+EMAILS_PER_MINUTE = int(_ENV.get("EMAILS_PER_MINUTE", "5"))
+DAILY_EMAIL_CAP = int(_ENV.get("DAILY_EMAIL_CAP", "50"))
 
 # Server Configuration
-HOST = os.getenv("HOST", "0.0.0.0")
-PORT = int(os.getenv("PORT", "8000"))
+HOST = _ENV.get("HOST", "0.0.0.0")
+PORT = int(_ENV.get("PORT", "8000"))
 
 # AI Configuration
-AI_API_KEY = os.getenv("AI_API_KEY", "")
-AI_PROVIDER = os.getenv("AI_PROVIDER", "anthropic")
+AI_API_KEY = _ENV.get("AI_API_KEY", "")
+AI_PROVIDER = _ENV.get("AI_PROVIDER", "anthropic")
 
 # Paths
 BASE_DIR = Path(__file__).parent.parent
@@ -37,15 +49,21 @@ DATA_DIR = BASE_DIR / "data"
 DATA_DIR.mkdir(exist_ok=True)
 
 # Email Verification Providers
-EMAIL_VERIFICATION_STRATEGY = os.getenv("EMAIL_VERIFICATION_STRATEGY", "smart")  # "smtp", "api", or "smart"
-TRUMAIL_ENABLED = os.getenv("TRUMAIL_ENABLED", "true").lower() == "true"
-HUNTER_API_KEY = os.getenv("HUNTER_API_KEY", "")
-KICKBOX_API_KEY = os.getenv("KICKBOX_API_KEY", "")
-ABSTRACT_API_KEY = os.getenv("ABSTRACT_API_KEY", "")
+EMAIL_VERIFICATION_STRATEGY = _ENV.get("EMAIL_VERIFICATION_STRATEGY", "smart")  # "smtp", "api", or "smart"
+TRUMAIL_ENABLED = _ENV.get("TRUMAIL_ENABLED", "true").lower() == "true"
+HUNTER_API_KEY = _ENV.get("HUNTER_API_KEY", "")
+KICKBOX_API_KEY = _ENV.get("KICKBOX_API_KEY", "")
+ABSTRACT_API_KEY = _ENV.get("ABSTRACT_API_KEY", "")
 
 # Scheduler Configuration
-SCHEDULER_PERSISTENCE_FILE = DATA_DIR / "scheduled_emails.json"
-DEFAULT_SEND_TIMEZONE = os.getenv("DEFAULT_SEND_TIMEZONE", "America/New_York")
+SCHEDULER_DB_FILE = DATA_DIR / "scheduled_emails.db"
+SCHEDULER_PERSISTENCE_FILE = DATA_DIR / "scheduled_emails.json"  # Legacy store, imported into the DB once
+DEFAULT_SEND_TIMEZONE = _ENV.get("DEFAULT_SEND_TIMEZONE", "America/New_York")
+TIMEZONE_CACHE_FILE = DATA_DIR / "timezone_cache.db"  # City -> timezone geocoding results
 OPTIMAL_SEND_HOURS = [10, 14]  # 10 AM, 2 PM local time
 OPTIMAL_SEND_DAYS = [1, 2, 3]  # Tuesday, Wednesday, Thursday (0=Monday)
 
+# Website Scanner Configuration
+WEBSITE_SCAN_CACHE_FILE = DATA_DIR / "website_scans.db"  # Recent scan results by URL
+WEBSITE_SCAN_CACHE_TTL = int(_ENV.get("WEBSITE_SCAN_CACHE_TTL", "86400"))  # Seconds; 0 disables
+
@@ -2,21 +2,50 @@
 Cold Outreach Email Automation System - FastAPI Main Application
 """
 
-from fastapi import FastAPI
+import hashlib
+import json
+import re
+import time
+from email.utils import formatdate
+
+from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import ORJSONResponse, Response
 from pathlib import Path
 
 from .routes import files, leads, actions
 from .config import HOST, PORT, DATA_DIR
 from .modules.scheduler import email_scheduler
+from .modules.smtp_verifier import close_smtp_pool, close_verifiers
+from .modules.website_scanner import close_scanner
+
+
+# Content-hashed asset names (e.g. app-3f9a1c2b.js) never change, so they can be cached for a year
+_HASHED_ASSET = re.compile(r"-[0-9a-f]{8,}\.(js|css)$")
+_ONE_YEAR = 31536000
+_SHORT_MAX_AGE = 300
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that adds Cache-Control/Expires headers to served assets."""
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if _HASHED_ASSET.search(str(full_path)):
+            response.headers["Cache-Control"] = f"public, max-age={_ONE_YEAR}, immutable"
+            response.headers["Expires"] = formatdate(time.time() + _ONE_YEAR, usegmt=True)
+        else:
+            response.headers["Cache-Control"] = f"public, max-age={_SHORT_MAX_AGE}"
+        return response
+
 
 # Create FastAPI app
 app = FastAPI(
     title="Cold Outreach Email Automation",
     description="System for managing cold email outreach with SMTP verification, website scanning, AI drafts, and Gmail sending.",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Scheduler Lifecycle Events
@@ -28,6 +57,12 @@ async def start_scheduler():
 async def shutdown_scheduler():
     email_scheduler.shutdown()
 
+@app.on_event("shutdown")
+async def close_connections():
+    close_smtp_pool()
+    await close_verifiers()
+    await close_scanner()
+
 # CORS middleware for frontend
 app.add_middleware(
     CORSMiddleware,
@@ -52,22 +87,36 @@ FRONTEND_DIR = PROJECT_DIR / "frontend"
 
 # Mount static files for frontend
 if FRONTEND_DIR.exists():
-    app.mount("/static", StaticFiles(directory=str(FRONTEND_DIR)), name="static")
+    app.mount("/static", CachedStaticFiles(directory=str(FRONTEND_DIR)), name="static")
+
+
+# Preload the SPA entry point once instead of stat-ing and reading it per request
+_INDEX_FILE = FRONTEND_DIR / "index.html"
+_INDEX_BYTES = _INDEX_FILE.read_bytes() if _INDEX_FILE.exists() else None
+_INDEX_HEADERS = {
+    "ETag": f'"{hashlib.md5(_INDEX_BYTES).hexdigest()}"',
+    "Cache-Control": "public, max-age=3600",
+} if _INDEX_BYTES is not None else {}
 
 
 @app.get("/")
-async def serve_frontend():
+async def serve_frontend(request: Request):
     """Serve the frontend index.html"""
-    index_file = FRONTEND_DIR / "index.html"
-    if index_file.exists():
-        return FileResponse(index_file)
+    if _INDEX_BYTES is not None:
+        if request.headers.get("if-none-match") == _INDEX_HEADERS["ETag"]:
+            return Response(status_code=304, headers=_INDEX_HEADERS)
+        return Response(content=_INDEX_BYTES, media_type="text/html", headers=_INDEX_HEADERS)
     return {"message": "Cold Outreach API is running. Frontend not found."}
 
 
+# Health payload never changes, so encode it once
+_HEALTH_JSON = json.dumps({"status": "healthy", "message": "Cold Outreach API is running"}).encode()
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "message": "Cold Outreach API is running"}
+    return Response(content=_HEALTH_JSON, media_type="application/json")
 
 
 # Run with: uvicorn backend.main:app --reload
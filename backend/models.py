@@ -2,7 +2,7 @@
 Pydantic models for the Cold Outreach Email Automation System.
 """
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
@@ -50,7 +50,6 @@ class Lead(BaseModel):
     email_sent_at: Optional[datetime] = None
     owner_name: Optional[str] = None
     sequence_step: SequenceStep = SequenceStep.NOT_SENT
-    sequence_step: SequenceStep = SequenceStep.NOT_SENT
     their_last_reply: Optional[str] = None
     my_reply_draft: Optional[str] = None
     scheduled_at: Optional[datetime] = None
@@ -4,10 +4,21 @@ Placeholder for AI-powered email draft generation.
 Ready for future integration with Claude/Anthropic APIs.
 """
 
-from typing import Optional, Dict, Any, List
+import re
+from functools import lru_cache
+from itertools import islice
+from typing import Optional, Dict, Any, List, Set, Iterator
 from ..models import Lead, EmailDraft
 
 
+__all__ = [
+    "generate_initial_draft",
+    "generate_followup_draft",
+    "generate_reply_draft",
+    "generate_draft_with_ai",
+]
+
+
 # Consultant voice template for mock drafts
 INITIAL_EMAIL_TEMPLATE = """Hi {owner_name},
 
@@ -47,6 +58,91 @@ Best,
 [Your Name]"""
 
 
+def _compile_template(template: str, *fields: str):
+    """Compile a str.format-style template once into a function that renders it as an f-string."""
+    source = f"def render({', '.join(fields)}):\n    return f{template!r}\n"
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    return namespace["render"]
+
+
+_render_initial = _compile_template(INITIAL_EMAIL_TEMPLATE, "owner_name", "company_context", "personalized_observations")
+_render_followup = _compile_template(GHOST_FOLLOWUP_TEMPLATE, "owner_name", "website", "brief_reminder")
+_render_reply = _compile_template(REPLY_TEMPLATE, "owner_name", "contextual_response")
+
+
+def _compile_keyword_matcher(keywords: Dict[str, str]) -> "re.Pattern[str]":
+    """Build one regex alternation so a single pass over the text finds every keyword."""
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile("|".join(re.escape(kw) for kw in ordered))
+
+
+def _match_tags(pattern: "re.Pattern[str]", keywords: Dict[str, str], text: str) -> Set[str]:
+    """Return the set of tags whose keywords occur in text."""
+    return {keywords[m.group(0)] for m in pattern.finditer(text)}
+
+
+# Scan summary phrases -> issue tag (legacy summary parsing)
+_SUMMARY_KEYWORDS = {
+    "not mobile responsive": "mobile",
+    "no viewport": "mobile",
+    "missing title": "seo",
+    "missing meta": "seo",
+    "no projects": "portfolio",
+    "no portfolio": "portfolio",
+    "no testimonials": "testimonials",
+    "no ssl": "ssl",
+}
+_SUMMARY_MATCHER = _compile_keyword_matcher(_SUMMARY_KEYWORDS)
+
+# Issue tag -> observation, in the order they appear in the email
+_SUMMARY_OBSERVATIONS = [
+    ("mobile",
+     "Your site isn't mobile-friendly, which means you're losing 60% of potential customers "
+     "who browse on their phones."),
+    ("seo",
+     "Your site is missing critical SEO elements. This makes it harder for homeowners "
+     "to find you when searching for contractors in your area."),
+    ("portfolio",
+     "I don't see a portfolio of your work. Visual proof is one of the most powerful "
+     "tools for converting visitors into paying customers."),
+    ("testimonials",
+     "You're missing customer testimonials. Homeowners want to see that others trust you "
+     "before they reach out."),
+    ("ssl",
+     "Your site doesn't have SSL (https), which browsers flag as 'Not Secure.' "
+     "This immediately puts homeowners on guard."),
+]
+
+# Reply intent -> trigger phrases, in priority order
+_REPLY_INTENTS = (
+    ("interested", frozenset({"interested", "tell me more", "curious", "sounds good"})),
+    ("busy", frozenset({"busy", "not right now", "maybe later"})),
+    ("pricing", frozenset({"cost", "price", "how much", "budget"})),
+    ("about", frozenset({"who are you", "company", "about you"})),
+)
+_REPLY_KEYWORDS = {phrase: tag for tag, phrases in _REPLY_INTENTS for phrase in phrases}
+_REPLY_MATCHER = _compile_keyword_matcher(_REPLY_KEYWORDS)
+
+_REPLY_RESPONSES = {
+    "interested": "Great to hear you're interested! Based on what I saw on your site, I think we could make some impactful improvements that would help you attract more qualified leads from homeowners in your area.",
+    "busy": "Totally understand—timing is everything. I'll keep this brief: when you're ready to look at the website, I'd be happy to walk you through a few quick ideas that won't take much of your time.",
+    "pricing": "Great question! The investment really depends on what you're looking to achieve. I'd love to understand your goals first so I can give you an accurate picture.",
+    "about": "Happy to share! I help home improvement contractors build websites that actually convert visitors into qualified leads. The focus is on showing your expertise and building trust with homeowners.",
+}
+_DEFAULT_REPLY_RESPONSE = "I appreciate you getting back to me. I'd love to learn more about what you're looking for and see if there's a way I can help."
+
+_DEFAULT_REPLY_SUBJECT = "Re: Your website"
+_SECOND_FOLLOWUP_SUBJECT = "Still interested in connecting?"
+
+
+@lru_cache(maxsize=8192)
+def _first_name(owner_name: str, name: str) -> str:
+    """Resolve the greeting name for a lead (first word of owner or company name)."""
+    full_name = owner_name or name or "there"
+    return full_name.split()[0] if ' ' in full_name else full_name
+
+
 def generate_initial_draft(lead: Lead, scan_summary: Optional[str] = None, notes: Optional[str] = None, audit_data: Optional[Dict[str, Any]] = None) -> EmailDraft:
     """
     Generate an initial cold email draft with personalized content based on audit data.
@@ -58,8 +154,7 @@ def generate_initial_draft(lead: Lead, scan_summary: Optional[str] = None, notes
         audit_data: Full audit data from website scan (preferred)
     """
     # Extract dynamic variables
-    owner_name = lead.owner_name or lead.name or "there"
-    first_name = owner_name.split()[0] if ' ' in owner_name else owner_name
+    first_name = _first_name(lead.owner_name or "", lead.name or "")
     company_name = lead.name or "your business"
     city = lead.city or ""
     category = lead.category or "contractor"
@@ -75,8 +170,8 @@ def generate_initial_draft(lead: Lead, scan_summary: Optional[str] = None, notes
     else:
         company_context = "your business"
     
-    # Build personalized observations using audit data
-    observations = _extract_observations_from_audit(audit_data, scan_summary, audit_score)
+    # Build personalized observations using audit data (only as many as will be shown)
+    observations = _extract_observations_from_audit(audit_data, scan_summary, audit_score, limit=3 - bool(notes))
     
     # Add manual notes if provided
     if notes:
@@ -92,7 +187,7 @@ def generate_initial_draft(lead: Lead, scan_summary: Optional[str] = None, notes
         personalized_observations = "• A few tweaks to the layout and messaging could help showcase your expertise and build trust with potential clients."
     
     # Generate email body with dynamic variables
-    body = INITIAL_EMAIL_TEMPLATE.format(
+    body = _render_initial(
         owner_name=first_name,
         company_context=company_context,
         personalized_observations=personalized_observations
@@ -101,133 +196,118 @@ def generate_initial_draft(lead: Lead, scan_summary: Optional[str] = None, notes
     # Generate personalized subject line
     subject = _generate_subject_line(lead, audit_score)
     
-    return EmailDraft(subject=subject, body=body)
-
-
-def _extract_observations_from_audit(audit_data: Optional[Dict[str, Any]], scan_summary: Optional[str], audit_score: Optional[int]) -> List[str]:
+    return EmailDraft.model_construct(subject=subject, body=body)
+
+
+# Static audit observations, referenced by _iter_audit_observations
+_OBS_MOBILE = (
+    "Your site isn't mobile-friendly. Since 60% of homeowners browse on their phones, "
+    "you're likely losing qualified leads before they even see your work."
+)
+_OBS_LICENSE = (
+    "I noticed your licensing information isn't prominently displayed. "
+    "In my experience, homeowners specifically look for this when choosing contractors—it's a major trust factor."
+)
+_OBS_SSL = (
+    "Your site doesn't have an SSL certificate (https). Modern browsers flag this as 'Not Secure,' "
+    "which immediately puts homeowners on guard."
+)
+_OBS_PORTFOLIO = (
+    "You don't have a portfolio showcasing your projects. Visual proof of quality work "
+    "is one of the most powerful tools for converting visitors into leads."
+)
+_OBS_TESTIMONIALS = (
+    "There are no customer testimonials or reviews visible on your site. "
+    "Social proof is critical—homeowners want to see that others trust you."
+)
+_OBS_SEO = (
+    "Your site is missing key SEO elements (title tags, meta descriptions). "
+    "This makes it much harder for homeowners to find you when searching for contractors in your area."
+)
+_OBS_WORDPRESS = (
+    "I see you're on WordPress—great platform for flexibility. "
+    "With a few plugin updates and template tweaks, we could showcase your work much more effectively."
+)
+
+
+def _extract_observations_from_audit(audit_data: Optional[Dict[str, Any]], scan_summary: Optional[str], audit_score: Optional[int], limit: Optional[int] = None) -> List[str]:
     """
     Extract specific, actionable observations from audit data.
-    Prioritizes high-impact issues.
+    Prioritizes high-impact issues; stops once `limit` observations are found.
     """
-    observations = []
-    
     if not audit_data:
         # Fallback to parsing scan summary if audit data not available
         if scan_summary:
-            return _parse_scan_summary(scan_summary)
+            return _parse_scan_summary(scan_summary.lower())
         return []
     
-    tech = audit_data.get('technical', {})
-    content = audit_data.get('content', {})
+    observations = _iter_audit_observations(
+        audit_data.get('technical', {}),
+        audit_data.get('content', {}),
+        audit_score
+    )
+    return list(islice(observations, limit))
+
+
+def _iter_audit_observations(tech: Dict[str, Any], content: Dict[str, Any], audit_score: Optional[int]) -> Iterator[str]:
+    """Yield audit observations lazily, most impactful first."""
+    # Low score leads the list
+    if audit_score is not None and audit_score < 60:
+        yield (
+            f"Your website scored {audit_score}/100 in my technical audit. "
+            "There are some quick wins that could dramatically improve how homeowners see your business online."
+        )
     
     # High Priority: Mobile Responsiveness (60% of traffic)
     if not tech.get('has_viewport_meta'):
-        observations.append(
-            "Your site isn't mobile-friendly. Since 60% of homeowners browse on their phones, "
-            "you're likely losing qualified leads before they even see your work."
-        )
+        yield _OBS_MOBILE
     
     # High Priority: Missing License Info (trust factor)
     if not content.get('has_license'):
-        observations.append(
-            "I noticed your licensing information isn't prominently displayed. "
-            "In my experience, homeowners specifically look for this when choosing contractors—it's a major trust factor."
-        )
+        yield _OBS_LICENSE
     
     # High Priority: No SSL (security concern)
     if tech.get('ssl_enabled') == False:
-        observations.append(
-            "Your site doesn't have an SSL certificate (https). Modern browsers flag this as 'Not Secure,' "
-            "which immediately puts homeowners on guard."
-        )
+        yield _OBS_SSL
     
     # Medium Priority: Missing Portfolio/Projects
     if not content.get('has_projects'):
-        observations.append(
-            "You don't have a portfolio showcasing your projects. Visual proof of quality work "
-            "is one of the most powerful tools for converting visitors into leads."
-        )
+        yield _OBS_PORTFOLIO
     
     # Medium Priority: No Testimonials
     if not content.get('has_testimonials'):
-        observations.append(
-            "There are no customer testimonials or reviews visible on your site. "
-            "Social proof is critical—homeowners want to see that others trust you."
-        )
+        yield _OBS_TESTIMONIALS
     
     # Medium Priority: SEO Issues
     if not tech.get('title') or not tech.get('meta_description'):
-        observations.append(
-            "Your site is missing key SEO elements (title tags, meta descriptions). "
-            "This makes it much harder for homeowners to find you when searching for contractors in your area."
-        )
+        yield _OBS_SEO
     
     # Low Priority: Platform-specific insights
     platform = tech.get('platform', '')
     if platform == 'WordPress':
         if not tech.get('has_viewport_meta') or not content.get('has_projects'):
-            observations.append(
-                "I see you're on WordPress—great platform for flexibility. "
-                "With a few plugin updates and template tweaks, we could showcase your work much more effectively."
-            )
+            yield _OBS_WORDPRESS
     elif platform == 'Wix' or platform == 'Squarespace':
-        observations.append(
+        yield (
             f"You're using {platform}, which is convenient but can be limiting for contractors. "
             "There are some quick customizations that could help you stand out and rank better locally."
         )
     
-    # Add score-based observation if available
-    if audit_score is not None:
-        if audit_score < 60:
-            observations.insert(0, 
-                f"Your website scored {audit_score}/100 in my technical audit. "
-                "There are some quick wins that could dramatically improve how homeowners see your business online."
-            )
-        elif audit_score < 80:
-            observations.append(
-                f"Your site scored {audit_score}/100—not bad, but there's real opportunity to stand out from competitors "
-                "with a few strategic improvements."
-            )
-    
-    return observations
+    # Middling score goes last
+    if audit_score is not None and 60 <= audit_score < 80:
+        yield (
+            f"Your site scored {audit_score}/100—not bad, but there's real opportunity to stand out from competitors "
+            "with a few strategic improvements."
+        )
 
 
-def _parse_scan_summary(scan_summary: str) -> List[str]:
+def _parse_scan_summary(scan_lower: str) -> List[str]:
     """
     Fallback method: Parse scan summary for issues (legacy support).
+    Expects the summary already lower-cased by the caller.
     """
-    observations = []
-    scan_lower = scan_summary.lower()
-    
-    if "not mobile responsive" in scan_lower or "no viewport" in scan_lower:
-        observations.append(
-            "Your site isn't mobile-friendly, which means you're losing 60% of potential customers "
-            "who browse on their phones."
-        )
-    
-    if "missing title" in scan_lower or "missing meta" in scan_lower:
-        observations.append(
-            "Your site is missing critical SEO elements. This makes it harder for homeowners "
-            "to find you when searching for contractors in your area."
-        )
-    
-    if "no projects" in scan_lower or "no portfolio" in scan_lower:
-        observations.append(
-            "I don't see a portfolio of your work. Visual proof is one of the most powerful "
-            "tools for converting visitors into paying customers."
-        )
-    
-    if "no testimonials" in scan_lower:
-        observations.append(
-            "You're missing customer testimonials. Homeowners want to see that others trust you "
-            "before they reach out."
-        )
-    
-    if "no ssl" in scan_lower:
-        observations.append(
-            "Your site doesn't have SSL (https), which browsers flag as 'Not Secure.' "
-            "This immediately puts homeowners on guard."
-        )
+    hits = _match_tags(_SUMMARY_MATCHER, _SUMMARY_KEYWORDS, scan_lower)
+    observations = [text for tag, text in _SUMMARY_OBSERVATIONS if tag in hits]
     
     if not observations:
         observations.append(
@@ -242,11 +322,14 @@ def _generate_subject_line(lead: Lead, audit_score: Optional[int]) -> str:
     """
     Generate a personalized subject line using lead data and audit score.
     """
-    city = lead.city
-    category = lead.category
-    
+    return _subject_for(lead.city, lead.category, bool(audit_score and audit_score < 60))
+
+
+@lru_cache(maxsize=2048)
+def _subject_for(city: Optional[str], category: Optional[str], low_score: bool) -> str:
+    """Subject line for a (city, category, low score) combination."""
     # Personalized subject lines based on available data
-    if audit_score and audit_score < 60:
+    if low_score:
         if city:
             return f"Quick wins for your {city} website"
         return "I found some quick wins for your website"
@@ -265,8 +348,7 @@ def generate_followup_draft(lead: Lead, followup_number: int = 1) -> EmailDraft:
     """
     Generate a ghost follow-up email draft.
     """
-    owner_name = lead.owner_name or lead.name or "there"
-    first_name = owner_name.split()[0] if ' ' in owner_name else owner_name
+    first_name = _first_name(lead.owner_name or "", lead.name or "")
     
     website = lead.website or "your site"
     
@@ -275,46 +357,38 @@ def generate_followup_draft(lead: Lead, followup_number: int = 1) -> EmailDraft:
         subject = f"Following up - {website}"
     else:
         brief_reminder = "Just a gentle bump on my earlier email. Happy to share some ideas whenever you have a moment."
-        subject = f"Still interested in connecting?"
+        subject = _SECOND_FOLLOWUP_SUBJECT
     
-    body = GHOST_FOLLOWUP_TEMPLATE.format(
+    body = _render_followup(
         owner_name=first_name,
         website=website,
         brief_reminder=brief_reminder
     )
     
-    return EmailDraft(subject=subject, body=body)
+    return EmailDraft.model_construct(subject=subject, body=body)
 
 
 def generate_reply_draft(lead: Lead, their_reply: str) -> EmailDraft:
     """
     Generate a reply to the lead's response.
     """
-    owner_name = lead.owner_name or lead.name or "there"
-    first_name = owner_name.split()[0] if ' ' in owner_name else owner_name
+    first_name = _first_name(lead.owner_name or "", lead.name or "")
     
     # Simple contextual response based on common reply patterns
     reply_lower = their_reply.lower()
     
-    if any(word in reply_lower for word in ['interested', 'tell me more', 'curious', 'sounds good']):
-        contextual_response = "Great to hear you're interested! Based on what I saw on your site, I think we could make some impactful improvements that would help you attract more qualified leads from homeowners in your area."
-    elif any(word in reply_lower for word in ['busy', 'not right now', 'maybe later']):
-        contextual_response = "Totally understand—timing is everything. I'll keep this brief: when you're ready to look at the website, I'd be happy to walk you through a few quick ideas that won't take much of your time."
-    elif any(word in reply_lower for word in ['cost', 'price', 'how much', 'budget']):
-        contextual_response = "Great question! The investment really depends on what you're looking to achieve. I'd love to understand your goals first so I can give you an accurate picture."
-    elif any(word in reply_lower for word in ['who are you', 'company', 'about you']):
-        contextual_response = "Happy to share! I help home improvement contractors build websites that actually convert visitors into qualified leads. The focus is on showing your expertise and building trust with homeowners."
-    else:
-        contextual_response = "I appreciate you getting back to me. I'd love to learn more about what you're looking for and see if there's a way I can help."
+    hits = _match_tags(_REPLY_MATCHER, _REPLY_KEYWORDS, reply_lower)
+    intent = next((tag for tag, _ in _REPLY_INTENTS if tag in hits), None)
+    contextual_response = _REPLY_RESPONSES.get(intent, _DEFAULT_REPLY_RESPONSE)
     
-    body = REPLY_TEMPLATE.format(
+    body = _render_reply(
         owner_name=first_name,
         contextual_response=contextual_response
     )
     
-    subject = f"Re: {lead.email_subject or 'Your website'}"
+    subject = f"Re: {lead.email_subject}" if lead.email_subject else _DEFAULT_REPLY_SUBJECT
     
-    return EmailDraft(subject=subject, body=body)
+    return EmailDraft.model_construct(subject=subject, body=body)
 
 
 # Future AI integration placeholder
@@ -324,7 +398,8 @@ async def generate_draft_with_ai(
     scan_summary: Optional[str] = None,
     notes: Optional[str] = None,
     their_reply: Optional[str] = None,
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    audit_data: Optional[Dict[str, Any]] = None
 ) -> EmailDraft:
     """
     Generate a draft using AI API.
@@ -339,6 +414,7 @@ async def generate_draft_with_ai(
         notes: Manual notes
         their_reply: Their reply (for reply drafts)
         api_key: AI API key (for future use)
+        audit_data: Full audit data from website scan (preferred over scan_summary)
     
     Returns:
         EmailDraft with subject and body
@@ -347,10 +423,10 @@ async def generate_draft_with_ai(
     # For now, use template-based generation
     
     if draft_type == "initial":
-        return generate_initial_draft(lead, scan_summary, notes)
+        return generate_initial_draft(lead, scan_summary, notes, audit_data)
     elif draft_type == "followup":
         return generate_followup_draft(lead)
     elif draft_type == "reply" and their_reply:
         return generate_reply_draft(lead, their_reply)
     else:
-        return generate_initial_draft(lead, scan_summary, notes)
+        return generate_initial_draft(lead, scan_summary, notes, audit_data)
@@ -4,23 +4,325 @@ Generates detailed website audit reports in JSON and PDF formats.
 """
 
 import json
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from operator import itemgetter
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from urllib.parse import urlsplit
+from xml.sax.saxutils import escape
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+# Bytes buffer for report JSON; a whole report (typically a few KB) fits, so the
+# streamed section writes reach disk in a single write() on close
+_JSON_WRITE_BUFFER = 1 << 16
+
+
+# Stdlib fallback encoder, built once (json.dumps with options creates a new encoder per call).
+# ensure_ascii=False keeps non-ASCII names/URLs as text; the result is UTF-8 encoded in one pass.
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+def _dumps(value: Any) -> bytes:
+    """Encode a value as indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return _JSON_ENCODER.encode(value).encode('utf-8')
+
+
+# Truthiness of the audit fields the report depends on, computed once per report.
+# The flags are hashable, so helpers are memoized on them (same site shape -> cache hit).
+TechFlags = namedtuple('TechFlags', 'has_title has_desc has_h1 has_viewport has_ssl ssl_disabled has_struct platform')
+
+# The six key content elements: audit key -> report label. Single source for the
+# ContentFlags fields, the found/missing labels and the per-element score.
+_CONTENT_ITEMS = (
+    ('has_projects', 'Projects/Portfolio'),
+    ('has_testimonials', 'Customer Testimonials'),
+    ('has_license', 'License Information'),
+    ('has_about', 'About Us Section'),
+    ('has_services', 'Services List'),
+    ('has_social_links', 'Social Media Links'),
+)
+_CONTENT_ITEM_POINTS = 100 // len(_CONTENT_ITEMS)
+
+ContentFlags = namedtuple('ContentFlags', [key for key, _ in _CONTENT_ITEMS])
+
+
+def _tech_flags(tech: Dict[str, Any]) -> TechFlags:
+    """Build TechFlags from technical audit data."""
+    platform = tech.get('platform')
+    return TechFlags(
+        has_title=bool(tech.get('title')),
+        has_desc=bool(tech.get('meta_description')),
+        has_h1=bool(tech.get('h1')),
+        has_viewport=bool(tech.get('has_viewport_meta')),
+        has_ssl=bool(tech.get('ssl_enabled')),
+        ssl_disabled=tech.get('ssl_enabled') is False,
+        has_struct=bool(tech.get('has_structured_data')),
+        platform=platform if platform and platform != 'Unknown' else None
+    )
+
+
+def _content_flags(content: Dict[str, Any]) -> ContentFlags:
+    """Build ContentFlags from content audit data."""
+    return ContentFlags._make(bool(content.get(key)) for key, _ in _CONTENT_ITEMS)
+
+
+@lru_cache(maxsize=1024)
+def _calculate_seo_score(tf: TechFlags) -> int:
+    """Calculate SEO score (0-100)."""
+    score = 0
+
+    # Title tag (20 points)
+    if tf.has_title:
+        score += 20
+
+    # Meta description (20 points)
+    if tf.has_desc:
+        score += 20
+
+    # H1 tag (15 points)
+    if tf.has_h1:
+        score += 15
+
+    # Mobile responsive (25 points)
+    if tf.has_viewport:
+        score += 25
+
+    # SSL (10 points)
+    if tf.has_ssl:
+        score += 10
+
+    # Structured data (10 points)
+    if tf.has_struct:
+        score += 10
+
+    return score
+
+
+@lru_cache(maxsize=1024)
+def _analyze_content(cf: ContentFlags) -> Tuple[int, Tuple[str, ...], Tuple[str, ...]]:
+    """Score content (0-100) and split elements into found/missing in one pass."""
+    score = 0
+    found = []
+    missing = []
+    for present, (_, label) in zip(cf, _CONTENT_ITEMS):
+        if present:
+            found.append(label)
+            score += _CONTENT_ITEM_POINTS
+        else:
+            missing.append(label)
+    return min(score, 100), tuple(found), tuple(missing)
+
+
+# Rule tables: (flag, output) pairs, where the output applies when the flag is False.
+# Table order is output order.
+_TECH_ISSUE_RULES = (
+    ('has_title', "Missing title tag"),
+    ('has_desc', "Missing meta description"),
+    ('has_h1', "Missing H1 tag"),
+    ('has_viewport', "Not mobile responsive"),
+)
+
+_TECH_RECOMMENDATION_RULES = (
+    ('has_title', "Add a descriptive title tag (50-60 characters)"),
+    ('has_desc', "Add meta description to improve click-through rate"),
+    ('has_viewport', "Make website mobile-responsive - 60% of traffic is mobile"),
+    ('has_struct', "Add Schema.org structured data for better search visibility"),
+)
+
+_CONTENT_RECOMMENDATION_RULES = (
+    ('has_projects', "Add a portfolio showcasing completed projects"),
+    ('has_testimonials', "Display customer testimonials to build trust"),
+    ('has_license', "Display license numbers prominently"),
+    ('has_about', "Add an About Us page introducing your team"),
+)
+
+_CONTENT_FINDING_RULES = (
+    ('has_projects', "No portfolio to showcase work"),
+    ('has_testimonials', "Missing social proof (testimonials)"),
+    ('has_license', "License information not displayed"),
+)
+
+# (flags, flag, action) - flags is "tech" or "content"; actions are stored as item tuples
+_ACTION_RULES = (
+    # High priority
+    ('tech', 'has_viewport', (
+        ("priority", "High"),
+        ("action", "Make website mobile-responsive"),
+        ("impact", "60% of visitors use mobile devices"),
+    )),
+    ('content', 'has_license', (
+        ("priority", "High"),
+        ("action", "Display license and insurance information"),
+        ("impact", "Builds trust with potential customers"),
+    )),
+    # Medium priority
+    ('tech', 'has_desc', (
+        ("priority", "Medium"),
+        ("action", "Add meta descriptions to pages"),
+        ("impact", "Improves search engine click-through rate"),
+    )),
+    ('content', 'has_projects', (
+        ("priority", "Medium"),
+        ("action", "Create portfolio/project gallery"),
+        ("impact", "Visual proof of quality work"),
+    )),
+    # Low priority
+    ('content', 'has_social_links', (
+        ("priority", "Low"),
+        ("action", "Add social media links"),
+        ("impact", "Increases engagement and credibility"),
+    )),
+)
+
+
+@lru_cache(maxsize=1024)
+def _get_technical_issues(tf: TechFlags) -> Tuple[str, ...]:
+    """Extract technical issues."""
+    issues = [msg for flag, msg in _TECH_ISSUE_RULES if not getattr(tf, flag)]
+    # Only an explicit ssl_enabled=False counts; unknown SSL status is not an issue
+    if tf.ssl_disabled:
+        issues.append("SSL certificate not detected")
+    return tuple(issues)
+
+
+@lru_cache(maxsize=1024)
+def _get_technical_recommendations(tf: TechFlags) -> Tuple[str, ...]:
+    """Generate technical recommendations."""
+    return tuple(msg for flag, msg in _TECH_RECOMMENDATION_RULES if not getattr(tf, flag))
+
+
+@lru_cache(maxsize=1024)
+def _get_content_recommendations(cf: ContentFlags) -> Tuple[str, ...]:
+    """Generate content recommendations."""
+    return tuple(msg for flag, msg in _CONTENT_RECOMMENDATION_RULES if not getattr(cf, flag))
+
+
+@lru_cache(maxsize=1024)
+def _generate_key_findings(tf: TechFlags, cf: ContentFlags) -> Tuple[str, ...]:
+    """Generate top 3-5 key findings."""
+    findings = []
+
+    # Technical findings
+    if not tf.has_viewport:
+        findings.append("Website is not mobile-friendly")
+    if not tf.has_title or not tf.has_desc:
+        findings.append("Missing critical SEO elements")
+
+    # Content findings
+    findings += [msg for flag, msg in _CONTENT_FINDING_RULES if not getattr(cf, flag)]
+
+    # Platform (only when detected)
+    if tf.platform:
+        findings.append(f"Running on {tf.platform}")
+
+    return tuple(findings[:5])
+
+
+@lru_cache(maxsize=1024)
+def _generate_action_items(tf: TechFlags, cf: ContentFlags) -> Tuple[Tuple[Tuple[str, str], ...], ...]:
+    """Generate prioritized action items (as item tuples; callers rebuild dicts)."""
+    flags = {'tech': tf, 'content': cf}
+    return tuple(action for source, flag, action in _ACTION_RULES if not getattr(flags[source], flag))
+
+
+# ReportLab is only imported once a PDF is requested; JSON-only callers never load it
+PdfStyles = namedtuple('PdfStyles', 'sample title heading score_table action_table')
+
+
+@lru_cache(maxsize=None)
+def _pdf_styles() -> PdfStyles:
+    """Import ReportLab and build the PDF styles shared by every report (first PDF only)."""
+    from reportlab import rl_config
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+
+    # ReportLab's C accelerators ship separately as rl_accel (reportlab[accel]).
+    # ReportLab picks them up automatically; without them it silently falls back
+    # to the pure-Python font metric and stream encoding helpers.
+    # Write compressed page streams as raw binary rather than ASCII85-encoding them
+    rl_config.useA85 = 0
+
+    # Brand colours, parsed once and shared by every style below
+    brand_blue = colors.HexColor('#2c5aa0')
+    dark_text = colors.HexColor('#1a1a1a')
+    cell_background = colors.beige
+    sample = getSampleStyleSheet()
+    return PdfStyles(
+        sample=sample,
+        title=ParagraphStyle(
+            'CustomTitle',
+            parent=sample['Heading1'],
+            fontSize=24,
+            textColor=dark_text,
+            spaceAfter=30,
+            alignment=TA_CENTER
+        ),
+        heading=ParagraphStyle(
+            'CustomHeading',
+            parent=sample['Heading2'],
+            fontSize=16,
+            textColor=brand_blue,
+            spaceAfter=12,
+            spaceBefore=12
+        ),
+        score_table=TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), brand_blue),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), cell_background),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ]),
+        action_table=TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), brand_blue),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (0, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), cell_background),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP')
+        ])
+    )
+
+
+_ACTION_HEADER = ('Priority', 'Action', 'Impact')
+_ACTION_ROW = itemgetter('priority', 'action', 'impact')
+
+
+def _bullets(items: Iterable[str], style: Any) -> Any:
+    """Render a bullet list as one Paragraph (one markup parse instead of one per item)."""
+    from reportlab.platypus import Paragraph
+    return Paragraph("<br/>".join(f"• {escape(str(item))}" for item in items), style)
 
 
 class AuditReportGenerator:
     """Generates comprehensive audit reports from website scan data."""
-    
+
+    # Often created per scan, so skip the per-instance __dict__
+    __slots__ = ('output_dir', '_output_dir_str')
+
     def __init__(self, output_dir: str = "data/audit_reports"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Report paths are built with os.path.join on this string (no per-report Path objects)
+        self._output_dir_str = str(self.output_dir)
     
     def generate_report(
         self, 
@@ -35,144 +337,160 @@ class AuditReportGenerator:
         Returns:
             Dict with paths to generated files: {"json": path, "pdf": path}
         """
-        # Create report data structure
-        report_data = self._create_report_data(url, audit_data, decision_makers)
+        # One clock read for both the filename stamp and the report metadata
+        now = datetime.now()
+        generated_at = now.isoformat()
+        
+        # JSON-only reports are streamed section by section; the PDF needs the full dict
+        if format == "json":
+            report_data = None
+            sections = self._iter_report_sections(url, audit_data, decision_makers, generated_at)
+        else:
+            report_data = self._create_report_data(url, audit_data, decision_makers, generated_at)
+            sections = report_data.items()
         
         # Generate unique filename based on domain and timestamp
-        domain = url.split("//")[-1].split("/")[0].replace("www.", "")
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        host = urlsplit(url if "//" in url else "//" + url).hostname or ""
+        domain = host[4:] if host.startswith("www.") else host
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         base_filename = f"{domain}_{timestamp}"
         
         result = {}
         
+        base_path = os.path.join(self._output_dir_str, base_filename)
+        json_path = base_path + ".json"
+        pdf_path = base_path + ".pdf"
+        
         # Generate JSON
         if format in ["json", "both"]:
-            json_path = self.output_dir / f"{base_filename}.json"
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(report_data, f, indent=2, ensure_ascii=False)
-            result["json"] = str(json_path)
+            self._write_json(sections, json_path)
+            result["json"] = json_path
         
         # Generate PDF
         if format in ["pdf", "both"]:
-            pdf_path = self.output_dir / f"{base_filename}.pdf"
-            self._generate_pdf(report_data, str(pdf_path))
-            result["pdf"] = str(pdf_path)
+            self._generate_pdf(report_data, pdf_path)
+            result["pdf"] = pdf_path
         
         return result
     
+    def generate_reports_batch(
+        self,
+        jobs: List[Tuple[str, Dict[str, Any], Optional[List[Dict[str, Any]]]]],
+        format: str = "both",
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Generate reports for many sites in parallel worker processes.
+        
+        Args:
+            jobs: (url, audit_data, decision_makers) tuples
+            
+        Returns:
+            One generate_report() result per job, in input order
+        """
+        if not jobs:
+            return []
+        
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(jobs) // (4 * workers))
+        run_job = partial(_generate_report_job, self._output_dir_str, format)
+        
+        # Processes rather than threads: PDF layout is CPU-bound and ReportLab keeps global state
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run_job, jobs, chunksize=chunksize))
+    
+    def _write_json(self, sections: Iterable[Tuple[str, Any]], json_path: str):
+        """Write top-level report sections to disk as they are produced."""
+        try:
+            with open(json_path, 'wb', buffering=_JSON_WRITE_BUFFER) as f:
+                separator = b"{\n  "
+                for key, value in sections:
+                    f.write(separator)
+                    f.write(_dumps(key))
+                    f.write(b": ")
+                    f.write(_dumps(value).replace(b"\n", b"\n  "))
+                    separator = b",\n  "
+                f.write(b"\n}")
+        except Exception:
+            # Don't leave a truncated report behind
+            if os.path.exists(json_path):
+                os.remove(json_path)
+            raise
+    
     def _create_report_data(
         self, 
         url: str, 
         audit_data: Dict[str, Any],
-        decision_makers: List[Dict[str, Any]] = None
+        decision_makers: List[Dict[str, Any]] = None,
+        generated_at: Optional[str] = None
     ) -> Dict[str, Any]:
         """Create structured report data."""
+        return dict(self._iter_report_sections(url, audit_data, decision_makers, generated_at))
+    
+    def _iter_report_sections(
+        self, 
+        url: str, 
+        audit_data: Dict[str, Any],
+        decision_makers: List[Dict[str, Any]] = None,
+        generated_at: Optional[str] = None
+    ) -> Iterator[Tuple[str, Any]]:
+        """Yield (key, section) pairs of the report in output order."""
         tech = audit_data.get('technical', {})
         content = audit_data.get('content', {})
+        tf = _tech_flags(tech)
+        cf = _content_flags(content)
         
         # Calculate scores
-        seo_score = self._calculate_seo_score(tech)
-        content_score = self._calculate_content_score(content)
+        seo_score = _calculate_seo_score(tf)
+        content_score, found_elements, missing_elements = _analyze_content(cf)
         overall_score = int((seo_score + content_score) / 2)
         
-        return {
-            "report_metadata": {
-                "url": url,
-                "generated_at": datetime.now().isoformat(),
-                "report_version": "1.0"
-            },
-            "executive_summary": {
-                "overall_score": overall_score,
-                "seo_score": seo_score,
-                "content_score": content_score,
-                "grade": self._score_to_grade(overall_score),
-                "key_findings": self._generate_key_findings(tech, content)
-            },
-            "technical_seo": {
-                "score": seo_score,
-                "details": {
-                    "title": tech.get('title'),
-                    "has_title": bool(tech.get('title')),
-                    "meta_description": tech.get('meta_description'),
-                    "has_meta_description": bool(tech.get('meta_description')),
-                    "h1_tag": tech.get('h1'),
-                    "has_h1": bool(tech.get('h1')),
-                    "mobile_responsive": tech.get('has_viewport_meta', False),
-                    "platform": tech.get('platform', 'Unknown'),
-                    "ssl_enabled": tech.get('ssl_enabled', None),
-                    "has_structured_data": tech.get('has_structured_data', False)
-                },
-                "issues": self._get_technical_issues(tech),
-                "recommendations": self._get_technical_recommendations(tech)
+        yield "report_metadata", {
+            "url": url,
+            "generated_at": generated_at or datetime.now().isoformat(),
+            "report_version": "1.0"
+        }
+        yield "executive_summary", {
+            "overall_score": overall_score,
+            "seo_score": seo_score,
+            "content_score": content_score,
+            "grade": self._score_to_grade(overall_score),
+            "key_findings": list(_generate_key_findings(tf, cf))
+        }
+        yield "technical_seo", {
+            "score": seo_score,
+            "details": {
+                "title": tech.get('title'),
+                "has_title": tf.has_title,
+                "meta_description": tech.get('meta_description'),
+                "has_meta_description": tf.has_desc,
+                "h1_tag": tech.get('h1'),
+                "has_h1": tf.has_h1,
+                "mobile_responsive": tech.get('has_viewport_meta', False),
+                "platform": tech.get('platform', 'Unknown'),
+                "ssl_enabled": tech.get('ssl_enabled', None),
+                "has_structured_data": tech.get('has_structured_data', False)
             },
-            "content_analysis": {
-                "score": content_score,
-                "details": {
-                    "has_projects": content.get('has_projects', False),
-                    "has_testimonials": content.get('has_testimonials', False),
-                    "has_license": content.get('has_license', False),
-                    "has_about": content.get('has_about', False),
-                    "has_services": content.get('has_services', False),
-                    "has_social_links": content.get('has_social_links', False)
-                },
-                "found_elements": self._get_found_elements(content),
-                "missing_elements": self._get_missing_elements(content),
-                "recommendations": self._get_content_recommendations(content)
+            "issues": list(_get_technical_issues(tf)),
+            "recommendations": list(_get_technical_recommendations(tf))
+        }
+        yield "content_analysis", {
+            "score": content_score,
+            "details": {
+                "has_projects": content.get('has_projects', False),
+                "has_testimonials": content.get('has_testimonials', False),
+                "has_license": content.get('has_license', False),
+                "has_about": content.get('has_about', False),
+                "has_services": content.get('has_services', False),
+                "has_social_links": content.get('has_social_links', False)
             },
-            "decision_makers": decision_makers or [],
-            "emails_found": audit_data.get('emails_found', []),
-            "action_items": self._generate_action_items(tech, content)
+            "found_elements": list(found_elements),
+            "missing_elements": list(missing_elements),
+            "recommendations": list(_get_content_recommendations(cf))
         }
-    
-    def _calculate_seo_score(self, tech: Dict[str, Any]) -> int:
-        """Calculate SEO score (0-100)."""
-        score = 0
-        
-        # Title tag (20 points)
-        if tech.get('title'):
-            score += 20
-        
-        # Meta description (20 points)
-        if tech.get('meta_description'):
-            score += 20
-        
-        # H1 tag (15 points)
-        if tech.get('h1'):
-            score += 15
-        
-        # Mobile responsive (25 points)
-        if tech.get('has_viewport_meta'):
-            score += 25
-        
-        # SSL (10 points)
-        if tech.get('ssl_enabled'):
-            score += 10
-        
-        # Structured data (10 points)
-        if tech.get('has_structured_data'):
-            score += 10
-        
-        return score
-    
-    def _calculate_content_score(self, content: Dict[str, Any]) -> int:
-        """Calculate content score (0-100)."""
-        score = 0
-        max_per_item = 100 // 6  # 6 key content elements
-        
-        if content.get('has_projects'):
-            score += max_per_item
-        if content.get('has_testimonials'):
-            score += max_per_item
-        if content.get('has_license'):
-            score += max_per_item
-        if content.get('has_about'):
-            score += max_per_item
-        if content.get('has_services'):
-            score += max_per_item
-        if content.get('has_social_links'):
-            score += max_per_item
-        
-        return min(score, 100)
+        yield "decision_makers", decision_makers or []
+        yield "emails_found", audit_data.get('emails_found', [])
+        yield "action_items", [dict(action) for action in _generate_action_items(tf, cf)]
     
     def _score_to_grade(self, score: int) -> str:
         """Convert numeric score to letter grade."""
@@ -187,185 +505,34 @@ class AuditReportGenerator:
         else:
             return "F"
     
-    def _get_technical_issues(self, tech: Dict[str, Any]) -> List[str]:
-        """Extract technical issues."""
-        issues = []
-        if not tech.get('title'):
-            issues.append("Missing title tag")
-        if not tech.get('meta_description'):
-            issues.append("Missing meta description")
-        if not tech.get('h1'):
-            issues.append("Missing H1 tag")
-        if not tech.get('has_viewport_meta'):
-            issues.append("Not mobile responsive")
-        if tech.get('ssl_enabled') is False:
-            issues.append("SSL certificate not detected")
-        return issues
-    
-    def _get_technical_recommendations(self, tech: Dict[str, Any]) -> List[str]:
-        """Generate technical recommendations."""
-        recs = []
-        if not tech.get('title'):
-            recs.append("Add a descriptive title tag (50-60 characters)")
-        if not tech.get('meta_description'):
-            recs.append("Add meta description to improve click-through rate")
-        if not tech.get('has_viewport_meta'):
-            recs.append("Make website mobile-responsive - 60% of traffic is mobile")
-        if not tech.get('has_structured_data'):
-            recs.append("Add Schema.org structured data for better search visibility")
-        return recs
-    
-    def _get_found_elements(self, content: Dict[str, Any]) -> List[str]:
-        """Get list of found content elements."""
-        found = []
-        mapping = {
-            'has_projects': 'Projects/Portfolio',
-            'has_testimonials': 'Customer Testimonials',
-            'has_license': 'License Information',
-            'has_about': 'About Us Section',
-            'has_services': 'Services List',
-            'has_social_links': 'Social Media Links'
-        }
-        for key, label in mapping.items():
-            if content.get(key):
-                found.append(label)
-        return found
-    
-    def _get_missing_elements(self, content: Dict[str, Any]) -> List[str]:
-        """Get list of missing content elements."""
-        missing = []
-        mapping = {
-            'has_projects': 'Projects/Portfolio',
-            'has_testimonials': 'Customer Testimonials',
-            'has_license': 'License Information',
-            'has_about': 'About Us Section',
-            'has_services': 'Services List',
-            'has_social_links': 'Social Media Links'
-        }
-        for key, label in mapping.items():
-            if not content.get(key):
-                missing.append(label)
-        return missing
-    
-    def _get_content_recommendations(self, content: Dict[str, Any]) -> List[str]:
-        """Generate content recommendations."""
-        recs = []
-        if not content.get('has_projects'):
-            recs.append("Add a portfolio showcasing completed projects")
-        if not content.get('has_testimonials'):
-            recs.append("Display customer testimonials to build trust")
-        if not content.get('has_license'):
-            recs.append("Display license numbers prominently")
-        if not content.get('has_about'):
-            recs.append("Add an About Us page introducing your team")
-        return recs
-    
-    def _generate_key_findings(self, tech: Dict[str, Any], content: Dict[str, Any]) -> List[str]:
-        """Generate top 3-5 key findings."""
-        findings = []
-        
-        # Technical findings
-        if not tech.get('has_viewport_meta'):
-            findings.append("Website is not mobile-friendly")
-        if not tech.get('title') or not tech.get('meta_description'):
-            findings.append("Missing critical SEO elements")
-        
-        # Content findings
-        if not content.get('has_projects'):
-            findings.append("No portfolio to showcase work")
-        if not content.get('has_testimonials'):
-            findings.append("Missing social proof (testimonials)")
-        if not content.get('has_license'):
-            findings.append("License information not displayed")
-        
-        # Platform
-        if tech.get('platform') != 'Unknown':
-            findings.append(f"Running on {tech['platform']}")
-        
-        return findings[:5]
-    
-    def _generate_action_items(self, tech: Dict[str, Any], content: Dict[str, Any]) -> List[Dict[str, str]]:
-        """Generate prioritized action items."""
-        actions = []
-        
-        # High priority
-        if not tech.get('has_viewport_meta'):
-            actions.append({
-                "priority": "High",
-                "action": "Make website mobile-responsive",
-                "impact": "60% of visitors use mobile devices"
-            })
-        
-        if not content.get('has_license'):
-            actions.append({
-                "priority": "High",
-                "action": "Display license and insurance information",
-                "impact": "Builds trust with potential customers"
-            })
-        
-        # Medium priority
-        if not tech.get('meta_description'):
-            actions.append({
-                "priority": "Medium",
-                "action": "Add meta descriptions to pages",
-                "impact": "Improves search engine click-through rate"
-            })
-        
-        if not content.get('has_projects'):
-            actions.append({
-                "priority": "Medium",
-                "action": "Create portfolio/project gallery",
-                "impact": "Visual proof of quality work"
-            })
-        
-        # Low priority
-        if not content.get('has_social_links'):
-            actions.append({
-                "priority": "Low",
-                "action": "Add social media links",
-                "impact": "Increases engagement and credibility"
-            })
-        
-        return actions
-    
     def _generate_pdf(self, report_data: Dict[str, Any], output_path: str):
         """Generate PDF report using ReportLab."""
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table
+        
+        pdf_styles = _pdf_styles()
         doc = SimpleDocTemplate(output_path, pagesize=letter)
         story = []
-        styles = getSampleStyleSheet()
-        
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#1a1a1a'),
-            spaceAfter=30,
-            alignment=TA_CENTER
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#2c5aa0'),
-            spaceAfter=12,
-            spaceBefore=12
-        )
+        append = story.append
+        normal = pdf_styles.sample['Normal']
         
+        title_style = pdf_styles.title
+        heading_style = pdf_styles.heading
+
         # Title
-        story.append(Paragraph("Website Audit Report", title_style))
-        story.append(Spacer(1, 0.2 * inch))
+        append(Paragraph("Website Audit Report", title_style))
+        append(Spacer(1, 0.2 * inch))
         
         # Metadata
         metadata = report_data['report_metadata']
-        story.append(Paragraph(f"<b>Website:</b> {metadata['url']}", styles['Normal']))
-        story.append(Paragraph(f"<b>Generated:</b> {metadata['generated_at'][:10]}", styles['Normal']))
-        story.append(Spacer(1, 0.3 * inch))
+        append(Paragraph(f"<b>Website:</b> {metadata['url']}", normal))
+        append(Paragraph(f"<b>Generated:</b> {metadata['generated_at'][:10]}", normal))
+        append(Spacer(1, 0.3 * inch))
         
         # Executive Summary
         summary = report_data['executive_summary']
-        story.append(Paragraph("Executive Summary", heading_style))
+        append(Paragraph("Executive Summary", heading_style))
         
         # Score table
         score_data = [
@@ -376,90 +543,76 @@ class AuditReportGenerator:
         ]
         
         score_table = Table(score_data, colWidths=[2*inch, 1.5*inch, 1*inch])
-        score_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5aa0')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        score_table.setStyle(pdf_styles.score_table)
         
-        story.append(score_table)
-        story.append(Spacer(1, 0.2 * inch))
+        append(score_table)
+        append(Spacer(1, 0.2 * inch))
         
         # Key Findings
         if summary['key_findings']:
-            story.append(Paragraph("<b>Key Findings:</b>", styles['Normal']))
-            for finding in summary['key_findings']:
-                story.append(Paragraph(f"• {finding}", styles['Normal']))
-            story.append(Spacer(1, 0.2 * inch))
+            append(Paragraph("<b>Key Findings:</b>", normal))
+            append(_bullets(summary['key_findings'], normal))
+            append(Spacer(1, 0.2 * inch))
         
         # Technical SEO
         tech_seo = report_data['technical_seo']
-        story.append(Paragraph("Technical SEO Analysis", heading_style))
+        append(Paragraph("Technical SEO Analysis", heading_style))
         
         if tech_seo['issues']:
-            story.append(Paragraph("<b>Issues Found:</b>", styles['Normal']))
-            for issue in tech_seo['issues']:
-                story.append(Paragraph(f"• {issue}", styles['Normal']))
-            story.append(Spacer(1, 0.1 * inch))
+            append(Paragraph("<b>Issues Found:</b>", normal))
+            append(_bullets(tech_seo['issues'], normal))
+            append(Spacer(1, 0.1 * inch))
         
         if tech_seo['recommendations']:
-            story.append(Paragraph("<b>Recommendations:</b>", styles['Normal']))
-            for rec in tech_seo['recommendations']:
-                story.append(Paragraph(f"• {rec}", styles['Normal']))
-            story.append(Spacer(1, 0.2 * inch))
+            append(Paragraph("<b>Recommendations:</b>", normal))
+            append(_bullets(tech_seo['recommendations'], normal))
+            append(Spacer(1, 0.2 * inch))
         
         # Content Analysis
         content = report_data['content_analysis']
-        story.append(Paragraph("Content Analysis", heading_style))
+        append(Paragraph("Content Analysis", heading_style))
         
         if content['found_elements']:
-            story.append(Paragraph(f"<b>Found ({len(content['found_elements'])}):</b> " + 
-                                 ", ".join(content['found_elements']), styles['Normal']))
-            story.append(Spacer(1, 0.1 * inch))
+            append(Paragraph(f"<b>Found ({len(content['found_elements'])}):</b> " + 
+                                 ", ".join(content['found_elements']), normal))
+            append(Spacer(1, 0.1 * inch))
         
         if content['missing_elements']:
-            story.append(Paragraph(f"<b>Missing ({len(content['missing_elements'])}):</b> " + 
-                                 ", ".join(content['missing_elements']), styles['Normal']))
-            story.append(Spacer(1, 0.2 * inch))
+            append(Paragraph(f"<b>Missing ({len(content['missing_elements'])}):</b> " + 
+                                 ", ".join(content['missing_elements']), normal))
+            append(Spacer(1, 0.2 * inch))
         
         # Decision Makers
         if report_data['decision_makers']:
-            story.append(Paragraph("Decision Makers Found", heading_style))
-            for dm in report_data['decision_makers']:
-                story.append(Paragraph(f"• {dm['name']} - {dm.get('title', 'N/A')}", styles['Normal']))
-            story.append(Spacer(1, 0.2 * inch))
+            append(Paragraph("Decision Makers Found", heading_style))
+            append(_bullets(
+                (f"{dm['name']} - {dm.get('title', 'N/A')}" for dm in report_data['decision_makers']),
+                normal
+            ))
+            append(Spacer(1, 0.2 * inch))
         
         # Action Items
         if report_data['action_items']:
-            story.append(Paragraph("Recommended Actions", heading_style))
-            
-            action_data = [['Priority', 'Action', 'Impact']]
-            for action in report_data['action_items']:
-                action_data.append([
-                    action['priority'],
-                    action['action'],
-                    action['impact']
-                ])
+            append(Paragraph("Recommended Actions", heading_style))
             
-            action_table = Table(action_data, colWidths=[1*inch, 2.5*inch, 2.5*inch])
-            action_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5aa0')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('VALIGN', (0, 0), (-1, -1), 'TOP')
-            ]))
+            # Header plus one (priority, action, impact) row per item, built in a single list
+            action_rows = map(_ACTION_ROW, report_data['action_items'])
+            action_table = Table([_ACTION_HEADER, *action_rows], colWidths=[1*inch, 2.5*inch, 2.5*inch])
+            action_table.setStyle(pdf_styles.action_table)
             
-            story.append(action_table)
+            append(action_table)
         
         # Build PDF
         doc.build(story)
+
+
+@lru_cache(maxsize=None)
+def _worker_generator(output_dir: str) -> AuditReportGenerator:
+    """One generator per worker process and output directory."""
+    return AuditReportGenerator(output_dir)
+
+
+def _generate_report_job(output_dir: str, format: str, job: Tuple) -> Dict[str, str]:
+    """Process-pool entry point for generate_reports_batch()."""
+    url, audit_data, decision_makers = job
+    return _worker_generator(output_dir).generate_report(url, audit_data, decision_makers, format)
@@ -4,12 +4,19 @@ Reads and writes Excel files while preserving data and adding new columns.
 """
 
 from pathlib import Path
-from typing import List, Dict, Optional, Any
-from datetime import datetime
+from typing import List, Dict, Optional, Any, Iterator, Tuple
+from datetime import date, datetime
+from functools import lru_cache
+from operator import attrgetter
 import openpyxl
 from openpyxl import Workbook
 import shutil
 
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # pragma: no cover - python-calamine is optional
+    CalamineWorkbook = None
+
 from ..models import Lead, EmailVerificationStatus, SequenceStep
 from ..config import DATA_DIR
 
@@ -27,6 +34,43 @@ NEW_COLUMNS = [
     'my_reply_draft'
 ]
 
+# Lead fields saved as sheet columns (everything else comes from extra_data),
+# and the ones that need converting back to their sheet representation
+LEAD_COLUMNS = frozenset(ORIGINAL_COLUMNS + NEW_COLUMNS)
+ENUM_COLUMNS = frozenset(['email_verified', 'sequence_step'])
+DATETIME_COLUMNS = frozenset(['verification_checked_at', 'website_scan_at', 'email_sent_at'])
+
+# Sheet value -> enum member (unknown values fall back to the default in _row_to_lead)
+VERIFICATION_STATUS_BY_VALUE = {status.value: status for status in EmailVerificationStatus}
+SEQUENCE_STEP_BY_VALUE = {step.value: step for step in SequenceStep}
+
+# Read buffer for CSV uploads
+CSV_READ_BUFFER = 1 << 20
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> Optional[datetime]:
+    """Parse an ISO timestamp string (memoized: batch-updated rows share timestamps)."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _as_openpyxl_value(value: Any) -> Any:
+    """
+    Convert a calamine cell value to what openpyxl returns for the same cell:
+    empty cells are None, whole numbers are ints and dates are midnight datetimes
+    (times and durations already come back as time/timedelta from both).
+    """
+    if value == "":
+        return None
+    if type(value) is float and value.is_integer():
+        return int(value)
+    if type(value) is date:
+        return datetime(value.year, value.month, value.day)
+    return value
+
 
 class ExcelHandler:
     """Handles reading and writing Excel files with lead data."""
@@ -35,23 +79,51 @@ class ExcelHandler:
         self.file_path = Path(file_path)
         self.workbook: Optional[Workbook] = None
         self.leads: List[Lead] = []
+        self._id_index: Dict[int, int] = {}  # lead id -> position in self.leads
         self.column_mapping: Dict[str, int] = {}
         self.all_columns: List[str] = []
     
     def load(self) -> List[Lead]:
         """Load leads from Excel or CSV file."""
         if self.file_path.suffix.lower() == '.csv':
-            return self._load_csv()
+            leads = self._load_csv()
         else:
-            return self._load_excel()
+            leads = self._load_excel()
+        self._id_index = {lead.id: i for i, lead in enumerate(leads)}
+        return leads
+
+    def _iter_excel_rows(self) -> Iterator[Tuple[Any, ...]]:
+        """Yield sheet rows as value tuples, using calamine's Rust parser when available."""
+        if CalamineWorkbook is None:
+            self.workbook = openpyxl.load_workbook(self.file_path, data_only=True, read_only=True)
+            try:
+                yield from self.workbook.active.values
+            finally:
+                # Close the workbook as we are done reading
+                self.workbook.close()
+            return
+        
+        # calamine doesn't expose the active sheet; read its name with openpyxl in read-only
+        # mode (only the workbook metadata is parsed) so both paths load the same sheet
+        metadata = openpyxl.load_workbook(self.file_path, read_only=True)
+        try:
+            sheet_name = metadata.active.title
+        finally:
+            metadata.close()
+        
+        # Whole sheet parsed in one call; keep leading empty rows/columns like openpyxl does
+        workbook = CalamineWorkbook.from_path(str(self.file_path))
+        try:
+            values = workbook.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False)
+        finally:
+            workbook.close()
+        
+        for row in values:
+            yield tuple(_as_openpyxl_value(v) for v in row)
 
     def _load_excel(self) -> List[Lead]:
         """Load leads from Excel file."""
-        self.workbook = openpyxl.load_workbook(self.file_path, data_only=True, read_only=True)
-        sheet = self.workbook.active
-        
-        # Get all rows generator
-        rows = sheet.iter_rows(values_only=True)
+        rows = self._iter_excel_rows()
         
         # Get headers from first row
         try:
@@ -59,12 +131,10 @@ class ExcelHandler:
         except StopIteration:
             return [] # Empty file
             
-        headers = []
-        for idx, cell_value in enumerate(header_row):
-            if cell_value:
-                headers.append(str(cell_value).lower().strip())
-            else:
-                headers.append(f"column_{idx+1}")
+        headers = [
+            str(cell_value).lower().strip() if cell_value else f"column_{idx+1}"
+            for idx, cell_value in enumerate(header_row)
+        ]
         
         self.all_columns = headers.copy()
         self.column_mapping = {header: idx for idx, header in enumerate(headers)}
@@ -85,17 +155,10 @@ class ExcelHandler:
             if not any(v is not None and str(v).strip() != "" for v in row_values):
                 continue
             
-            row_data = {}
-            for i, val in enumerate(row_values):
-                if i < len(headers):
-                    row_data[headers[i]] = val
-            
-            lead = self._row_to_lead(row_idx, row_data)
+            # Values past the last header are dropped (zip stops at the shorter side)
+            lead = self._row_to_lead(row_idx, dict(zip(headers, row_values)))
             self.leads.append(lead)
         
-        # Close the workbook as we are done reading
-        self.workbook.close()
-        
         return self.leads
 
     def _load_csv(self) -> List[Lead]:
@@ -104,11 +167,15 @@ class ExcelHandler:
         
         self.leads = []
         try:
-            with open(self.file_path, mode='r', encoding='utf-8-sig', errors='replace') as f:
-                reader = csv.DictReader(f)
-                headers = [h.lower().strip() for h in reader.fieldnames]
-                # Re-map reader headers to lower case for consistency
-                reader.fieldnames = headers
+            # Large read buffer so the C parser works on long runs of text between refills
+            with open(self.file_path, mode='r', encoding='utf-8-sig', errors='replace',
+                      newline='', buffering=CSV_READ_BUFFER) as f:
+                # Plain tuple rows; each row is zipped against the lower-cased headers once
+                reader = csv.reader(f)
+                try:
+                    headers = [h.lower().strip() for h in next(reader)]
+                except StopIteration:
+                    return []  # Empty file
                 
                 self.all_columns = headers.copy()
                 self.column_mapping = {header: idx for idx, header in enumerate(headers)}
@@ -119,11 +186,12 @@ class ExcelHandler:
                         self.all_columns.append(new_col)
                         self.column_mapping[new_col] = len(self.all_columns) - 1
                 
-                for i, row in enumerate(reader, 1):
+                # Blank lines don't get an id (as with DictReader); rows of empty cells do
+                for i, row in enumerate(filter(None, reader), 1):
                     # Skip empty rows
-                    if not any(row.values()):
+                    if not any(row):
                         continue
-                    lead = self._row_to_lead(i, row)
+                    lead = self._row_to_lead(i, dict(zip(headers, row)))
                     self.leads.append(lead)
         except Exception as e:
             print(f"Error loading CSV: {e}")
@@ -143,32 +211,44 @@ class ExcelHandler:
 
     def _save_excel(self, output_path: Path) -> Path:
         """Save leads back to Excel file."""
-        # Create a new workbook
-        wb = Workbook()
-        sheet = wb.active
-        
-        # Write headers
-        for col_idx, col_name in enumerate(self.all_columns, 1):
-            sheet.cell(row=1, column=col_idx, value=col_name)
+        # Write-only workbook streams rows straight to the sheet XML (no per-cell objects kept)
+        wb = Workbook(write_only=True)
+        sheet = wb.create_sheet()
         
-        # Write data
-        for row_idx, lead in enumerate(self.leads, 2):
-            lead_dict = self._lead_to_row(lead)
-            for col_name, col_idx in self.column_mapping.items():
-                value = lead_dict.get(col_name)
-                sheet.cell(row=row_idx, column=col_idx + 1, value=value)
+        # Header row, then one row per lead in column order
+        columns = self._columns()
+        sheet.append(self.all_columns)
+        for row in zip(*(columns[col] for col in self.all_columns)):
+            sheet.append(row)
         
         wb.save(output_path)
         return output_path
 
     def _save_csv(self, output_path: Path) -> Path:
         """Save leads back to CSV file."""
+        columns = self._columns()
+        try:
+            # Imported here rather than at module load, so app start doesn't pay for pyarrow
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+        except ImportError:  # pragma: no cover - pyarrow is optional
+            pa = None
+        if pa is not None:
+            # Arrow formats and writes the whole table in C++; cells go in as text
+            # (None stays empty), matching what csv.writer would emit for them
+            arrays = [
+                pa.array([None if v is None else str(v) for v in columns[col]], type=pa.string())
+                for col in self.all_columns
+            ]
+            table = pa.Table.from_arrays(arrays, names=self.all_columns)
+            pa_csv.write_csv(table, str(output_path))
+            return output_path
+        
         import csv
         with open(output_path, mode='w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=self.all_columns)
-            writer.writeheader()
-            for lead in self.leads:
-                writer.writerow(self._lead_to_row(lead))
+            writer = csv.writer(f)
+            writer.writerow(self.all_columns)
+            writer.writerows(zip(*(columns[col] for col in self.all_columns)))
         return output_path
 
     def _row_to_lead(self, row_id: int, row_data: Dict[str, Any]) -> Lead:
@@ -182,17 +262,11 @@ class ExcelHandler:
         
         # Parse verification status
         email_verified_str = str(row_data.get('email_verified', '') or '').lower()
-        try:
-            email_verified = EmailVerificationStatus(email_verified_str)
-        except ValueError:
-            email_verified = EmailVerificationStatus.PENDING
+        email_verified = VERIFICATION_STATUS_BY_VALUE.get(email_verified_str, EmailVerificationStatus.PENDING)
         
         # Parse sequence step
         sequence_step_str = str(row_data.get('sequence_step', '') or '').lower()
-        try:
-            sequence_step = SequenceStep(sequence_step_str)
-        except ValueError:
-            sequence_step = SequenceStep.NOT_SENT
+        sequence_step = SEQUENCE_STEP_BY_VALUE.get(sequence_step_str, SequenceStep.NOT_SENT)
         
         # Parse datetime fields
         verification_checked_at = self._parse_datetime(row_data.get('verification_checked_at'))
@@ -201,9 +275,8 @@ class ExcelHandler:
         
         # Collect extra data (columns we don't explicitly handle)
         extra_data = {}
-        known_fields = set(ORIGINAL_COLUMNS + NEW_COLUMNS)
         for key, value in row_data.items():
-            if key not in known_fields and value is not None:
+            if key not in LEAD_COLUMNS and value is not None:
                 extra_data[key] = value
         
         return Lead(
@@ -234,62 +307,54 @@ class ExcelHandler:
             return None
         if isinstance(value, datetime):
             return value
-        try:
-            return datetime.fromisoformat(str(value))
-        except:
-            return None
+        return _parse_iso(str(value))
 
-    def _lead_to_row(self, lead: Lead) -> Dict[str, Any]:
-        """Convert a Lead object back to a row dict."""
-        row = {
-            'name': lead.name,
-            'email': lead.email,
-            'website': lead.website,
-            'category': lead.category,
-            'city': lead.city,
-            'email_verified': lead.email_verified.value,
-            'verification_checked_at': lead.verification_checked_at.isoformat() if lead.verification_checked_at else None,
-            'website_scan_summary': lead.website_scan_summary,
-            'website_scan_at': lead.website_scan_at.isoformat() if lead.website_scan_at else None,
-            'my_notes': lead.my_notes,
-            'email_subject': lead.email_subject,
-            'email_draft': lead.email_draft,
-            'email_sent_at': lead.email_sent_at.isoformat() if lead.email_sent_at else None,
-            'owner_name': lead.owner_name,
-            'sequence_step': lead.sequence_step.value,
-            'their_last_reply': lead.their_last_reply,
-            'my_reply_draft': lead.my_reply_draft,
-        }
-
-        
-        # Add extra data
-        row.update(lead.extra_data)
-        
-        return row
+    def _columns(self) -> Dict[str, List[Any]]:
+        """Column-major view of the leads for saving: column name -> values in lead order."""
+        leads = self.leads
+        columns = {}
+        for col in self.all_columns:
+            if col in columns:
+                continue
+            if col in ENUM_COLUMNS:
+                values = [v.value for v in map(attrgetter(col), leads)]
+            elif col in DATETIME_COLUMNS:
+                # One comprehension per column; only the None check branches per value
+                values = [v.isoformat() if v is not None else None for v in map(attrgetter(col), leads)]
+            elif col in LEAD_COLUMNS:
+                values = list(map(attrgetter(col), leads))
+            else:
+                # Columns we don't explicitly handle round-trip through extra_data
+                values = [lead.extra_data.get(col) for lead in leads]
+            columns[col] = values
+        return columns
     
     def update_lead(self, lead_id: int, updates: Dict[str, Any]) -> Optional[Lead]:
         """Update a specific lead by ID."""
-        for i, lead in enumerate(self.leads):
-            if lead.id == lead_id:
-                lead_dict = lead.model_dump()
-                lead_dict.update(updates)
-                self.leads[i] = Lead(**lead_dict)
-                return self.leads[i]
-        return None
+        i = self._id_index.get(lead_id)
+        if i is None:
+            return None
+        # Shallow copy with the changed fields swapped in: no model_dump() of the whole
+        # lead and no re-validation (update values are already typed internally).
+        # Unknown keys are dropped, as they were when rebuilding from a dict.
+        self.leads[i] = self.leads[i].model_copy(
+            update={k: v for k, v in updates.items() if k in Lead.model_fields}
+        )
+        return self.leads[i]
     
     def get_lead(self, lead_id: int) -> Optional[Lead]:
         """Get a specific lead by ID."""
-        for lead in self.leads:
-            if lead.id == lead_id:
-                return lead
-        return None
+        i = self._id_index.get(lead_id)
+        return self.leads[i] if i is not None else None
     
     def backup(self) -> Path:
         """Create a backup of the current file."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_name = f"{self.file_path.stem}_backup_{timestamp}{self.file_path.suffix}"
         backup_path = DATA_DIR / backup_name
-        shutil.copy2(self.file_path, backup_path)
+        # Contents only: copyfile uses the kernel's zero-copy path (sendfile) where available,
+        # and the backup name already carries the timestamp copy2's metadata copy would preserve
+        shutil.copyfile(self.file_path, backup_path)
         return backup_path
 
 
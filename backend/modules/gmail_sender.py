@@ -4,27 +4,33 @@ Sends emails via Gmail using app password authentication.
 """
 
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage
+from email.policy import SMTP
 import asyncio
 from datetime import datetime, date
+from functools import lru_cache
 from typing import Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor
+import threading
 import time
 
 from ..config import GMAIL_ADDRESS, GMAIL_APP_PASSWORD, EMAILS_PER_MINUTE, DAILY_EMAIL_CAP
 
 
 # Thread pool for blocking SMTP operations
-_executor = ThreadPoolExecutor(max_workers=2)
+_executor = ThreadPoolExecutor(max_workers=8)
 
-# Daily send tracking
+# Plain text -> HTML paragraph content
+_HTML_BODY_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "\n": "<br>"})
+
+# Daily send tracking (shared by executor and scheduler threads, guarded by _count_lock)
 _daily_send_count = 0
 _last_send_date: Optional[date] = None
+_count_lock = threading.Lock()
 
 
 def _reset_daily_count_if_needed():
-    """Reset daily count if it's a new day."""
+    """Reset daily count if it's a new day. Caller must hold _count_lock."""
     global _daily_send_count, _last_send_date
     today = date.today()
     if _last_send_date != today:
@@ -32,10 +38,30 @@ def _reset_daily_count_if_needed():
         _last_send_date = today
 
 
+def _reserve_send_slot() -> bool:
+    """Atomically check the daily cap and count one send against it."""
+    global _daily_send_count
+    with _count_lock:
+        _reset_daily_count_if_needed()
+        if _daily_send_count >= DAILY_EMAIL_CAP:
+            return False
+        _daily_send_count += 1
+        return True
+
+
+def _release_send_slot():
+    """Give back a reserved slot after a failed send."""
+    global _daily_send_count
+    with _count_lock:
+        if _daily_send_count > 0:
+            _daily_send_count -= 1
+
+
 def get_daily_send_count() -> int:
     """Get the current daily send count."""
-    _reset_daily_count_if_needed()
-    return _daily_send_count
+    with _count_lock:
+        _reset_daily_count_if_needed()
+        return _daily_send_count
 
 
 def get_remaining_daily_quota() -> int:
@@ -43,66 +69,142 @@ def get_remaining_daily_quota() -> int:
     return max(0, DAILY_EMAIL_CAP - get_daily_send_count())
 
 
+@lru_cache(maxsize=32)
+def _from_header(from_email: str, from_name: str = None):
+    """
+    Parsed From header, shared by every message from the same sender.
+    
+    The message keeps a pre-parsed header object as-is, so a batch parses the
+    sender address once instead of once per email.
+    """
+    return SMTP.header_factory('From', f"{from_name} <{from_email}>" if from_name else from_email)
+
+
+def _build_mime(
+    to_email: str,
+    subject: str,
+    body: str,
+    from_email: str,
+    from_name: str = None,
+    html: bool = False
+) -> EmailMessage:
+    """Build the message: a single text/plain part, plus an HTML alternative if asked for."""
+    msg = EmailMessage(policy=SMTP)
+    msg['Subject'] = subject
+    msg['From'] = _from_header(from_email, from_name)
+    msg['To'] = to_email
+    
+    # Plain text version; quoted-printable keeps non-ASCII text (e.g. em dashes) 7-bit clean,
+    # since the message goes out without the BODY=8BITMIME extension
+    msg.set_content(body, cte='quoted-printable')
+    
+    if html:
+        # HTML version (simple conversion): escape markup and turn newlines into <br> in one pass
+        html_body = f"<html><body><p>{body.translate(_HTML_BODY_TABLE)}</p></body></html>"
+        msg.add_alternative(html_body, subtype='html', cte='quoted-printable')
+    
+    return msg
+
+
+class SmtpSession:
+    """
+    One authenticated Gmail SMTP connection shared by a batch of sends.
+    
+    Connects lazily on the first send (so auth errors surface per email, like
+    single sends) and reconnects once if the server dropped the connection.
+    """
+    
+    def __init__(self):
+        self.server: Optional[smtplib.SMTP_SSL] = None
+    
+    def __enter__(self) -> "SmtpSession":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def _connect(self):
+        server = smtplib.SMTP_SSL('smtp.gmail.com', 465)
+        try:
+            server.login(GMAIL_ADDRESS, GMAIL_APP_PASSWORD)
+        except Exception:
+            server.close()
+            raise
+        self.server = server
+    
+    def sendmail(self, from_email: str, to_email: str, msg: bytes):
+        if self.server is None:
+            self._connect()
+        try:
+            self.server.sendmail(from_email, to_email, msg)
+        except smtplib.SMTPServerDisconnected:
+            self.server = None
+            self._connect()
+            self.server.sendmail(from_email, to_email, msg)
+    
+    def close(self):
+        if self.server is not None:
+            try:
+                self.server.quit()
+            except smtplib.SMTPException:
+                self.server.close()
+            self.server = None
+
+
 def _send_email_sync(
     to_email: str,
     subject: str,
     body: str,
     from_email: str = None,
-    from_name: str = None
+    from_name: str = None,
+    session: Optional[SmtpSession] = None,
+    html: bool = False
 ) -> Tuple[bool, str]:
     """
     Synchronous email sending via Gmail SMTP.
     
+    Sends over `session` when given, otherwise opens a connection for this email.
+    Plain text only unless `html` is set (then an HTML alternative is attached too).
+    
     Returns:
         Tuple of (success, message)
     """
-    global _daily_send_count
-    
     if from_email is None:
         from_email = GMAIL_ADDRESS
     
     if not GMAIL_ADDRESS or not GMAIL_APP_PASSWORD:
         return False, "Gmail credentials not configured"
     
-    # Check daily limit
-    _reset_daily_count_if_needed()
-    if _daily_send_count >= DAILY_EMAIL_CAP:
+    # Check the daily limit and reserve this send in one step, so concurrent
+    # senders can't both pass the check and overshoot the cap
+    if not _reserve_send_slot():
         return False, f"Daily email cap reached ({DAILY_EMAIL_CAP})"
     
     try:
-        # Create message
-        msg = MIMEMultipart('alternative')
-        msg['Subject'] = subject
-        msg['From'] = f"{from_name} <{from_email}>" if from_name else from_email
-        msg['To'] = to_email
-        
-        # Plain text version
-        text_part = MIMEText(body, 'plain', 'utf-8')
-        msg.attach(text_part)
-        
-        # HTML version (simple conversion)
-        html_body = body.replace('\n', '<br>')
-        html_body = f"<html><body><p>{html_body}</p></body></html>"
-        html_part = MIMEText(html_body, 'html', 'utf-8')
-        msg.attach(html_part)
-        
-        # Connect to Gmail SMTP
-        with smtplib.SMTP_SSL('smtp.gmail.com', 465) as server:
-            server.login(GMAIL_ADDRESS, GMAIL_APP_PASSWORD)
-            server.sendmail(from_email, to_email, msg.as_string())
+        # SMTP policy: CRLF line endings, so the bytes go on the wire as-is
+        msg = _build_mime(to_email, subject, body, from_email, from_name, html).as_bytes()
         
-        # Update daily count
-        _daily_send_count += 1
+        if session is not None:
+            session.sendmail(from_email, to_email, msg)
+        else:
+            # Connect to Gmail SMTP
+            with smtplib.SMTP_SSL('smtp.gmail.com', 465) as server:
+                server.login(GMAIL_ADDRESS, GMAIL_APP_PASSWORD)
+                server.sendmail(from_email, to_email, msg)
         
         return True, "Email sent successfully"
         
     except smtplib.SMTPAuthenticationError:
+        _release_send_slot()
         return False, "Gmail authentication failed. Check your app password."
     except smtplib.SMTPRecipientsRefused:
+        _release_send_slot()
         return False, f"Recipient refused: {to_email}"
     except smtplib.SMTPException as e:
+        _release_send_slot()
         return False, f"SMTP error: {str(e)}"
     except Exception as e:
+        _release_send_slot()
         return False, f"Error sending email: {str(e)}"
 
 
@@ -111,12 +213,14 @@ async def send_email(
     subject: str,
     body: str,
     from_email: str = None,
-    from_name: str = None
+    from_name: str = None,
+    session: Optional[SmtpSession] = None,
+    html: bool = False
 ) -> Tuple[bool, str]:
     """
     Async wrapper for sending email.
     """
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     return await loop.run_in_executor(
         _executor,
         _send_email_sync,
@@ -124,20 +228,53 @@ async def send_email(
         subject,
         body,
         from_email,
-        from_name
+        from_name,
+        session,
+        html
     )
 
 
+class AsyncTokenBucket:
+    """
+    Token bucket rate limiter: `rate_per_minute` tokens, holding at most `capacity`.
+    
+    With capacity 1 send starts are spaced exactly like a fixed delay, but a slow
+    send no longer holds back the next one.
+    """
+    
+    def __init__(self, rate_per_minute: float, capacity: int = 1):
+        self.interval = 60.0 / rate_per_minute
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) / self.interval)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.interval)
+
+
 async def send_emails_batch(
     emails: list,
-    rate_limit: int = None
+    rate_limit: int = None,
+    max_workers: int = 4
 ) -> list:
     """
     Send multiple emails with rate limiting.
     
     Args:
         emails: List of dicts with keys: to_email, subject, body
+            (optional: from_email, from_name, html)
         rate_limit: Emails per minute (default from config)
+        max_workers: Sends allowed in flight at once (one SMTP session each)
     
     Returns:
         List of (success, message) tuples
@@ -145,28 +282,45 @@ async def send_emails_batch(
     if rate_limit is None:
         rate_limit = EMAILS_PER_MINUTE
     
-    delay_seconds = 60.0 / rate_limit
-    results = []
+    bucket = AsyncTokenBucket(rate_limit)
     
-    for i, email_data in enumerate(emails):
-        # Check daily limit before each send
-        if get_remaining_daily_quota() <= 0:
-            results.append((False, "Daily email cap reached"))
-            continue
-        
-        success, message = await send_email(
-            to_email=email_data['to_email'],
-            subject=email_data['subject'],
-            body=email_data['body'],
-            from_email=email_data.get('from_email'),
-            from_name=email_data.get('from_name')
-        )
-        results.append((success, message))
-        
-        # Rate limiting delay (except for the last one)
-        if i < len(emails) - 1:
-            await asyncio.sleep(delay_seconds)
+    # Each in-flight send borrows its own authenticated session (one TLS handshake + login
+    # per session for the whole batch); the pool size bounds concurrency
+    sessions = [SmtpSession() for _ in range(max(1, min(max_workers, len(emails))))]
+    idle_sessions: asyncio.Queue = asyncio.Queue()
+    for session in sessions:
+        idle_sessions.put_nowait(session)
+    
+    async def send_one(email_data: dict) -> Tuple[bool, str]:
+        session = await idle_sessions.get()
+        try:
+            # Check daily limit before each send
+            if get_remaining_daily_quota() <= 0:
+                return False, "Daily email cap reached"
+            
+            await bucket.acquire()
+            return await send_email(
+                to_email=email_data['to_email'],
+                subject=email_data['subject'],
+                body=email_data['body'],
+                from_email=email_data.get('from_email'),
+                from_name=email_data.get('from_name'),
+                session=session,
+                html=email_data.get('html', False)
+            )
+        finally:
+            idle_sessions.put_nowait(session)
     
+    loop = asyncio.get_running_loop()
+    try:
+        # Every send settles before the sessions are closed under it; the first error is re-raised below
+        results = await asyncio.gather(*(send_one(email_data) for email_data in emails), return_exceptions=True)
+    finally:
+        for session in sessions:
+            await loop.run_in_executor(_executor, session.close)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
     return results
 
 
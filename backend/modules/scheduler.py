@@ -1,9 +1,11 @@
 """
 Email Scheduler Module
-Uses APScheduler for timing and JSON for persistence.
+Uses APScheduler for timing and SQLite for persistence.
 """
 import json
 import logging
+import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List
@@ -12,9 +14,9 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.jobstores.base import JobLookupError
 
 from ..models import SequenceStep
-from ..config import SCHEDULER_PERSISTENCE_FILE
+from ..config import SCHEDULER_DB_FILE, SCHEDULER_PERSISTENCE_FILE
 from ..modules.excel_handler import get_handler
-from ..modules.gmail_sender import send_email
+from ..modules.gmail_sender import _send_email_sync
 
 # Set up logging
 logging.basicConfig()
@@ -24,6 +26,19 @@ class EmailScheduler:
     def __init__(self):
         self.scheduler = BackgroundScheduler()
         self.persistence_file = Path(SCHEDULER_PERSISTENCE_FILE)
+        # One row per scheduled email, so each schedule/cancel/send is a single-row write.
+        # The connection is shared by request and scheduler threads, serialised by _db_lock.
+        self._db_lock = threading.Lock()
+        self._db = sqlite3.connect(str(SCHEDULER_DB_FILE), check_same_thread=False)
+        # WAL: each single-row commit appends to the log instead of rewriting pages + journal;
+        # still crash-safe, and NORMAL sync is durable enough for a WAL database
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS scheduled_emails ("
+            "lead_id INTEGER PRIMARY KEY, subject TEXT, body TEXT, run_date TEXT, created_at TEXT)"
+        )
+        self._db.commit()
         self.jobs_metadata = self._load_jobs_metadata()
         
     def start(self):
@@ -39,23 +54,65 @@ class EmailScheduler:
             self.scheduler.shutdown()
 
     def _load_jobs_metadata(self) -> Dict[str, Any]:
-        """Load jobs metadata from JSON file."""
-        if self.persistence_file.exists():
-            try:
-                with open(self.persistence_file, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Error loading scheduler persistence file: {e}")
-                return {}
-        return {}
+        """Load jobs metadata from the database (importing the legacy JSON file once)."""
+        self._import_legacy_metadata()
+        try:
+            with self._db_lock:
+                rows = self._db.execute(
+                    "SELECT lead_id, subject, body, run_date, created_at FROM scheduled_emails"
+                ).fetchall()
+        except sqlite3.Error as e:
+            print(f"Error loading scheduler database: {e}")
+            return {}
+        return {
+            str(lead_id): {
+                "lead_id": lead_id,
+                "subject": subject,
+                "body": body,
+                "run_date": run_date,
+                "created_at": created_at
+            }
+            for lead_id, subject, body, run_date, created_at in rows
+        }
 
-    def _save_jobs_metadata(self):
-        """Save jobs metadata to JSON file."""
+    def _import_legacy_metadata(self):
+        """Move jobs from the old JSON persistence file into the database."""
+        if not self.persistence_file.exists():
+            return
         try:
-            with open(self.persistence_file, 'w') as f:
-                json.dump(self.jobs_metadata, f, indent=2, default=str)
+            with open(self.persistence_file, 'r') as f:
+                legacy = json.load(f)
+            with self._db_lock, self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO scheduled_emails VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (int(job_id), job.get('subject'), job.get('body'), job.get('run_date'), job.get('created_at'))
+                        for job_id, job in legacy.items()
+                    ]
+                )
+            self.persistence_file.rename(self.persistence_file.with_suffix('.json.migrated'))
         except Exception as e:
-            print(f"Error saving scheduler persistence file: {e}")
+            print(f"Error importing scheduler persistence file: {e}")
+
+    def _save_job_metadata(self, job_id: str):
+        """Write one job's metadata row."""
+        job = self.jobs_metadata[job_id]
+        try:
+            with self._db_lock, self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO scheduled_emails VALUES (?, ?, ?, ?, ?)",
+                    (job['lead_id'], job['subject'], job['body'], job['run_date'], job['created_at'])
+                )
+        except sqlite3.Error as e:
+            print(f"Error saving scheduled email {job_id}: {e}")
+
+    def _delete_job_metadata(self, job_id: str):
+        """Delete one job's metadata row."""
+        try:
+            with self._db_lock, self._db:
+                self._db.execute("DELETE FROM scheduled_emails WHERE lead_id = ?", (int(job_id),))
+        except sqlite3.Error as e:
+            print(f"Error deleting scheduled email {job_id}: {e}")
 
     def _restore_jobs(self):
         """Restore jobs from metadata on startup."""
@@ -106,7 +163,7 @@ class EmailScheduler:
             "run_date": run_date.isoformat(),
             "created_at": datetime.now().isoformat()
         }
-        self._save_jobs_metadata()
+        self._save_job_metadata(job_id)
         
         return job_id
 
@@ -121,7 +178,7 @@ class EmailScheduler:
             
         if job_id in self.jobs_metadata:
             del self.jobs_metadata[job_id]
-            self._save_jobs_metadata()
+            self._delete_job_metadata(job_id)
             return True
         return False
 
@@ -140,7 +197,7 @@ class EmailScheduler:
         job_id = str(lead_id)
         if job_id in self.jobs_metadata:
             del self.jobs_metadata[job_id]
-            self._save_jobs_metadata()
+            self._delete_job_metadata(job_id)
             
         # Get handler
         handler = get_handler()
@@ -157,14 +214,10 @@ class EmailScheduler:
             print(f"Error: Lead {lead_id} has no email")
             return
 
-        # Send Email using sync context if needed or run async
-        # Since APScheduler runs in thread, we can call async code via asyncio.run or use sync version
-        # The send_email function from gmail_sender is async.
-        # We need to run it synchronously here.
-        import asyncio
-        
+        # APScheduler already runs this in a worker thread, so call the blocking
+        # SMTP path directly (no event loop or executor hop per send)
         try:
-            success, message = asyncio.run(send_email(lead.email, subject, body))
+            success, message = _send_email_sync(lead.email, subject, body)
         except Exception as e:
             print(f"Error sending email in scheduler: {e}")
             success = False
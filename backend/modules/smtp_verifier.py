@@ -3,28 +3,140 @@ SMTP Email Verifier Module.
 Verifies email deliverability using SMTP protocol without sending actual emails.
 """
 
+import dns.asyncresolver
 import dns.resolver
 import smtplib
 import socket
 import asyncio
-from typing import Tuple, List
-from concurrent.futures import ThreadPoolExecutor
+import logging
+import pkgutil
+import random
+import re
+import string
 import time
-from email_validator import validate_email, EmailNotValidError, EmailUndeliverableError
+from typing import Dict, Optional, Tuple, List
+from email_validator import validate_email, EmailNotValidError
 
-from ..config import VERIFIER_DELAY_SECONDS, VERIFIER_FROM_EMAIL
+try:
+    import aiosmtplib
+except ImportError:  # pragma: no cover - aiosmtplib is optional
+    aiosmtplib = None
+
+from ..config import VERIFIER_CONCURRENCY, VERIFIER_DELAY_SECONDS, VERIFIER_FROM_EMAIL
 from ..models import EmailVerificationStatus, VerificationResult
 from .verification_providers import (
-    EmailVerificationProvider,
+    CachingProvider,
     TrumailProvider,
     HunterProvider,
     KickboxProvider,
     AbstractAPIProvider
 )
 
+logger = logging.getLogger(__name__)
+
+# Latency caps so a dead or tarpitting MX can't stall a batch: per connect, per command,
+# the time after which no further MX host is tried, and the hard limit per address.
+_SMTP_CONNECT_TIMEOUT = 5
+_SMTP_COMMAND_TIMEOUT = 3
+_MX_ATTEMPT_BUDGET = 8
+_VERIFY_TIMEOUT = 10
+
+# Errors that mean we never got a usable SMTP conversation with the MX host
+_CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError,
+                      socket.timeout, socket.gaierror, ConnectionRefusedError)
+if aiosmtplib is not None:
+    _CONNECTION_ERRORS += (aiosmtplib.SMTPConnectError, aiosmtplib.SMTPServerDisconnected,
+                           aiosmtplib.SMTPTimeoutError)
+
+
+# Cheap shape check run before email-validator: one @, no whitespace, a dotted domain.
+# Deliberately loose so internationalised addresses still reach the full validator.
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s.]+$')
+
+# Addresses on these domains are decided without any DNS or SMTP work
+_DISPOSABLE_DOMAINS = frozenset(
+    line.strip().lower()
+    for line in pkgutil.get_data(__package__, 'disposable_domains.txt').decode('utf-8').splitlines()
+    if line.strip() and not line.startswith('#')
+)
+# Known webmail domains (never flagged) and the subset long enough to be safe typo targets
+_WEBMAIL_DOMAINS = frozenset((
+    'gmail.com', 'googlemail.com', 'yahoo.com', 'ymail.com', 'hotmail.com', 'outlook.com',
+    'live.com', 'msn.com', 'aol.com', 'icloud.com', 'me.com', 'mac.com', 'mail.com', 'email.com',
+    'gmx.com', 'protonmail.com', 'comcast.net', 'verizon.net', 'att.net', 'cox.net',
+    'sbcglobal.net', 'bellsouth.net', 'charter.net', 'yahoo.co.uk', 'hotmail.co.uk',
+))
+_TYPO_TARGETS = tuple(sorted(domain for domain in _WEBMAIL_DOMAINS if len(domain) >= 9))
+
+
+def _edit_distance(a: str, b: str) -> int:
+    """Damerau-Levenshtein distance (optimal string alignment)."""
+    prev2 = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        prev2, prev = prev, cur
+    return prev[-1]
+
 
-# Thread pool for running blocking SMTP operations
-_executor = ThreadPoolExecutor(max_workers=5)
+def _suggest_domain(domain: str) -> Optional[str]:
+    """Return the webmail domain `domain` is one edit away from, if any."""
+    if domain in _WEBMAIL_DOMAINS:
+        return None
+    for target in _TYPO_TARGETS:
+        if abs(len(target) - len(domain)) <= 1 and _edit_distance(domain, target) == 1:
+            return target
+    return None
+
+
+# One resolver pair for the whole process instead of a fresh one per dns.resolver.resolve()
+# call; the async one lets a batch resolve its domains concurrently. They share one cache.
+_resolver = dns.resolver.Resolver()
+_resolver.lifetime = 5
+_resolver.cache = dns.resolver.LRUCache(10_000)
+_async_resolver = dns.asyncresolver.Resolver()
+_async_resolver.lifetime = 5
+_async_resolver.cache = _resolver.cache
+
+# domain -> (expires_at, mx_hosts). Entries live for the record TTL (capped),
+# NXDOMAIN/no-MX answers for a shorter time; transient failures are not cached.
+_MX_CACHE_SIZE = 10_000
+_MX_CACHE_MAX_TTL = 3600
+_MX_NEGATIVE_TTL = 300
+_mx_cache: Dict[str, Tuple[float, List[str]]] = {}
+_MX_NEGATIVE_ERRORS = (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer)
+_MX_TRANSIENT_ERRORS = (dns.resolver.NoNameservers, dns.exception.Timeout)
+
+
+def _cached_mx(domain: str) -> Optional[List[str]]:
+    cached = _mx_cache.get(domain)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    return None
+
+
+def _cache_mx(domain: str, records) -> List[str]:
+    """Sort an MX answer by priority and cache it; `records` is None for a negative answer."""
+    if records is None:
+        hosts = []
+        ttl = _MX_NEGATIVE_TTL
+    else:
+        mx_hosts = [(record.preference, str(record.exchange).rstrip('.')) 
+                    for record in records]
+        mx_hosts.sort(key=lambda x: x[0])
+        hosts = [host for _, host in mx_hosts]
+        ttl = min(records.rrset.ttl, _MX_CACHE_MAX_TTL)
+    
+    if len(_mx_cache) >= _MX_CACHE_SIZE:
+        # Dicts keep insertion order, so this drops the oldest entry
+        del _mx_cache[next(iter(_mx_cache))]
+    _mx_cache[domain] = (time.monotonic() + ttl, hosts)
+    return hosts
 
 
 def get_mx_records(domain: str) -> List[str]:
@@ -32,69 +144,266 @@ def get_mx_records(domain: str) -> List[str]:
     Get MX records for a domain.
     Returns list of mail servers sorted by priority.
     """
+    cached = _cached_mx(domain)
+    if cached is not None:
+        return cached
     try:
-        records = dns.resolver.resolve(domain, 'MX')
-        mx_hosts = [(record.preference, str(record.exchange).rstrip('.')) 
-                    for record in records]
-        mx_hosts.sort(key=lambda x: x[0])
-        return [host for _, host in mx_hosts]
-    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, 
-            dns.resolver.NoNameservers, dns.exception.Timeout):
+        records = _resolver.resolve(domain, 'MX')
+    except _MX_NEGATIVE_ERRORS:
+        records = None
+    except _MX_TRANSIENT_ERRORS:
         return []
+    return _cache_mx(domain, records)
+
+
+async def get_mx_records_async(domain: str) -> List[str]:
+    """Non-blocking get_mx_records, sharing its cache."""
+    cached = _cached_mx(domain)
+    if cached is not None:
+        return cached
+    try:
+        records = await _async_resolver.resolve(domain, 'MX')
+    except _MX_NEGATIVE_ERRORS:
+        records = None
+    except _MX_TRANSIENT_ERRORS:
+        return []
+    return _cache_mx(domain, records)
+
 
+async def _smtp_connect(mx_host: str, helo_domain: str, port: int = 25):
+    """Open an SMTP session to an MX host and greet it with EHLO."""
+    if aiosmtplib is None:
+        # Blocking fallback: run smtplib in a worker thread
+        def connect():
+            smtp = smtplib.SMTP(timeout=_SMTP_CONNECT_TIMEOUT)
+            smtp.connect(mx_host, port)
+            smtp.sock.settimeout(_SMTP_COMMAND_TIMEOUT)
+            smtp.ehlo(helo_domain)
+            return smtp
+        return await asyncio.to_thread(connect)
+
+    smtp = aiosmtplib.SMTP(hostname=mx_host, port=port, timeout=_SMTP_COMMAND_TIMEOUT, start_tls=False)
+    await smtp.connect(timeout=_SMTP_CONNECT_TIMEOUT)
+    await smtp.ehlo(helo_domain)
+    return smtp
+
+
+async def _smtp_command(smtp, command: str, *args) -> Tuple[int, str]:
+    """Run an SMTP command and return (code, message); refusals are returned, not raised."""
+    if aiosmtplib is None:
+        return await asyncio.to_thread(getattr(smtp, command), *args)
+    try:
+        response = await getattr(smtp, command)(*args)
+    except aiosmtplib.SMTPResponseException as e:
+        return e.code, e.message
+    return response.code, response.message
+
+
+class _PooledSmtp:
+    """An open SMTP session plus the bookkeeping the pool needs to retire it."""
+    
+    __slots__ = ('key', 'smtp', 'opened_at', 'last_used', 'uses')
+    
+    def __init__(self, key: Tuple[str, int, str], smtp, opened_at: float):
+        self.key = key
+        self.smtp = smtp
+        self.opened_at = opened_at
+        self.last_used = opened_at
+        self.uses = 0
 
-def _verify_email_sync(email: str, from_email: str = None) -> Tuple[EmailVerificationStatus, str]:
+
+class SmtpConnectionPool:
     """
-    Synchronous SMTP verification.
-    Connects to mail server and checks if recipient is valid.
+    Idle SMTP sessions keyed by (MX host, port, HELO domain).
+    Verifying several addresses at the same MX reuses one connect + EHLO instead of
+    paying the handshake per address. Sessions are RSET before reuse, retired after
+    `max_uses` transactions or `max_age` seconds, and closed by a timer once idle for
+    `idle_timeout` so sessions don't linger after a verification run.
     """
-    if from_email is None:
-        from_email = VERIFIER_FROM_EMAIL
     
-    # 1. Syntax and Basic DNS check using email-validator
+    def __init__(self, max_uses: int = 100, max_age: float = 100.0, idle_timeout: float = 60.0):
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self.idle_timeout = idle_timeout
+        self._idle: Dict[Tuple[str, int, str], List[_PooledSmtp]] = {}
+        self._loop = None
+        self._reap_timer: Optional[asyncio.TimerHandle] = None
+    
+    async def get(self, mx_host: str, helo_domain: str, port: int = 25) -> _PooledSmtp:
+        """Return a ready session to `mx_host`, reusing an idle one when possible."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Sessions belong to the loop that opened them (check_catch_all runs its own)
+            self._drop_all()
+            self._loop = loop
+        
+        key = (mx_host, port, helo_domain)
+        idle = self._idle.get(key)
+        while idle:
+            conn = idle.pop()
+            if self._expired(conn, time.monotonic()):
+                self._drop(conn)
+                continue
+            try:
+                code, _ = await _smtp_command(conn.smtp, 'rset')
+            except Exception:
+                code = None
+            if code == 250:
+                return conn
+            self._drop(conn)
+        
+        smtp = await _smtp_connect(mx_host, helo_domain, port)
+        return _PooledSmtp(key, smtp, time.monotonic())
+    
+    async def release(self, conn: _PooledSmtp, reusable: bool = True) -> None:
+        """Hand a session back; broken or worn-out sessions are closed instead."""
+        now = time.monotonic()
+        conn.uses += 1
+        conn.last_used = now
+        if not reusable:
+            # Broken session: no point in a QUIT round trip
+            self._drop(conn)
+        elif conn.uses < self.max_uses and now - conn.opened_at < self.max_age:
+            self._idle.setdefault(conn.key, []).append(conn)
+            self._schedule_reap(now)
+        else:
+            try:
+                await _smtp_command(conn.smtp, 'quit')
+            except Exception:
+                self._drop(conn)
+        self._reap(now)
+    
+    def close(self) -> None:
+        """Close every idle session (e.g. on app shutdown)."""
+        self._drop_all()
+    
+    def _expired(self, conn: _PooledSmtp, now: float) -> bool:
+        return now - conn.last_used > self.idle_timeout or now - conn.opened_at > self.max_age
+    
+    def _schedule_reap(self, now: float) -> None:
+        """Arm a timer for just after the next idle session expires, if one isn't pending."""
+        if self._reap_timer is not None or not self._idle:
+            return
+        next_expiry = min(
+            min(conn.last_used + self.idle_timeout, conn.opened_at + self.max_age)
+            for idle in self._idle.values() for conn in idle
+        )
+        # A little slack so the session counts as expired when the timer fires
+        delay = max(next_expiry - now, 0.0) + 0.1
+        self._reap_timer = asyncio.get_running_loop().call_later(delay, self._on_reap_timer)
+    
+    def _on_reap_timer(self) -> None:
+        self._reap_timer = None
+        now = time.monotonic()
+        self._reap(now)
+        self._schedule_reap(now)
+    
+    def _reap(self, now: float) -> None:
+        """Close idle sessions that outlived the idle timeout."""
+        for key, idle in list(self._idle.items()):
+            live = [conn for conn in idle if not self._expired(conn, now)]
+            for conn in idle:
+                if self._expired(conn, now):
+                    self._drop(conn)
+            if live:
+                self._idle[key] = live
+            else:
+                del self._idle[key]
+    
+    def _drop_all(self) -> None:
+        if self._reap_timer is not None:
+            self._reap_timer.cancel()
+            self._reap_timer = None
+        for idle in self._idle.values():
+            for conn in idle:
+                self._drop(conn)
+        self._idle.clear()
+    
+    @staticmethod
+    def _drop(conn: _PooledSmtp) -> None:
+        """Close the socket without a QUIT round trip."""
+        try:
+            conn.smtp.close()
+        except Exception:
+            pass
+
+
+_pool = SmtpConnectionPool()
+
+
+def _precheck(email: str) -> Tuple[str, str, Optional[Tuple[EmailVerificationStatus, str]]]:
+    """
+    Checks that need no network: syntax (email-validator; the cached MX lookup does the
+    DNS work), disposable domains and webmail typos.
+    Returns (email, domain, verdict); verdict is only set when the address is decided here.
+    """
+    if not _EMAIL_RE.match(email):
+        return email, "", (EmailVerificationStatus.INVALID, "Syntax error: not a valid email address")
+    
     try:
-        # check_deliverability=True verifies domain and MX records
-        v = validate_email(email, check_deliverability=True)
-        # We'll use the normalized version
-        email = v.email
-        domain = v.domain
+        v = validate_email(email, check_deliverability=False)
     except EmailNotValidError as e:
-        return EmailVerificationStatus.INVALID, f"Syntax error: {str(e)}"
-    except EmailUndeliverableError as e:
-        return EmailVerificationStatus.INVALID, f"Domain error: {str(e)}"
-    except Exception as e:
-        # Other validation errors (likely network issues during DNS check)
-        pass # Fallback to manual MX check below if DNS check failed here but might work manually
+        return email, "", (EmailVerificationStatus.INVALID, f"Syntax error: {str(e)}")
     
-    # 2. Get MX records manually for better control
-    local_part, domain = email.rsplit('@', 1)
-    mx_hosts = get_mx_records(domain)
+    # We'll use the normalized version (the domain comes back lower-cased / IDNA-normalised)
+    email = v.email
+    domain = v.domain
     
-    if not mx_hosts:
-        return EmailVerificationStatus.INVALID, f"No MX records found for domain {domain}"
+    if domain in _DISPOSABLE_DOMAINS:
+        return email, domain, (EmailVerificationStatus.INVALID, "Disposable email domain")
+    suggestion = _suggest_domain(domain)
+    if suggestion:
+        return email, domain, (EmailVerificationStatus.UNKNOWN, f"Possible domain typo, did you mean {suggestion}?")
+    return email, domain, None
+
+
+def _no_mx(domain: str) -> Tuple[EmailVerificationStatus, str]:
+    return EmailVerificationStatus.INVALID, f"No MX records found for domain {domain}"
+
+
+async def _smtp_verify(email: str, mx_hosts: List[str], from_email: str,
+                       pool: Optional[SmtpConnectionPool] = None) -> Tuple[EmailVerificationStatus, str]:
+    """SMTP verification, capped at _VERIFY_TIMEOUT seconds per address."""
+    try:
+        return await asyncio.wait_for(_smtp_verify_hosts(email, mx_hosts, from_email, pool), _VERIFY_TIMEOUT)
+    except asyncio.TimeoutError:
+        return EmailVerificationStatus.UNKNOWN, "Could not verify via SMTP: timeout"
+
+
+async def _smtp_verify_hosts(email: str, mx_hosts: List[str], from_email: str,
+                             pool: Optional[SmtpConnectionPool] = None) -> Tuple[EmailVerificationStatus, str]:
+    """
+    SMTP verification.
+    Connects to mail server and checks if recipient is valid.
+    Sessions come from `pool`, the shared module pool by default.
+    """
+    if pool is None:
+        pool = _pool
     
-    # 3. Try SMTP verification
     # We use a more realistic HELO/EHLO domain. Ideally this should be a real domain pointing to your IP.
     helo_domain = from_email.split('@')[-1] if '@' in from_email else 'gmail.com'
     
     last_error = ""
-    for mx_host in mx_hosts[:2]:  # Try top 2 servers
+    deadline = time.monotonic() + _MX_ATTEMPT_BUDGET
+    for mx_host in mx_hosts:  # Try servers in priority order while the budget lasts
+        if last_error and time.monotonic() >= deadline:
+            break
         try:
-            smtp = smtplib.SMTP(timeout=15)
-            # Some servers require EHLO
-            smtp.connect(mx_host, 25)
-            smtp.ehlo(helo_domain)
-            
-            # Identify sender
-            code, message = smtp.mail(from_email)
-            if code != 250:
-                smtp.quit()
-                last_error = f"MAIL FROM rejected ({code}): {message}"
-                continue
-            
-            # The actual recipient check
-            code, message = smtp.rcpt(email)
-            smtp.quit()
+            conn = await pool.get(mx_host, helo_domain)
+            reusable = False
+            try:
+                # Identify sender
+                code, message = await _smtp_command(conn.smtp, 'mail', from_email)
+                if code != 250:
+                    reusable = code != 421
+                    last_error = f"MAIL FROM rejected ({code}): {message}"
+                    continue
+                
+                # The actual recipient check
+                code, message = await _smtp_command(conn.smtp, 'rcpt', email)
+                reusable = code != 421
+            finally:
+                await pool.release(conn, reusable)
             
             if code == 250:
                 return EmailVerificationStatus.VALID, "Mailbox exists"
@@ -109,8 +418,7 @@ def _verify_email_sync(email: str, from_email: str = None) -> Tuple[EmailVerific
                 last_error = f"Unexpected response ({code}): {message}"
                 continue
                 
-        except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, 
-                socket.timeout, socket.gaierror, ConnectionRefusedError) as e:
+        except _CONNECTION_ERRORS as e:
             last_error = f"Connection failed: {str(e)}"
             continue
         except Exception as e:
@@ -124,18 +432,33 @@ def _verify_email_sync(email: str, from_email: str = None) -> Tuple[EmailVerific
     return EmailVerificationStatus.UNKNOWN, f"Could not verify via SMTP: {last_error}"
 
 
+async def _verify_email_async(email: str, from_email: str = None,
+                              pool: Optional[SmtpConnectionPool] = None) -> Tuple[EmailVerificationStatus, str]:
+    """
+    Full verification of one address: syntax, MX lookup, then SMTP.
+    """
+    if from_email is None:
+        from_email = VERIFIER_FROM_EMAIL
+    
+    # 1. Syntax
+    email, domain, verdict = _precheck(email)
+    if verdict is not None:
+        return verdict
+    
+    # 2. Get MX records manually for better control
+    mx_hosts = await get_mx_records_async(domain)
+    if not mx_hosts:
+        return _no_mx(domain)
+    
+    # 3. Try SMTP verification
+    return await _smtp_verify(email, mx_hosts, from_email, pool)
+
+
 async def verify_email(email: str, from_email: str = None) -> VerificationResult:
     """
-    Async wrapper for email verification.
-    Runs the synchronous SMTP check in a thread pool.
+    Verify a single email address over SMTP.
     """
-    loop = asyncio.get_event_loop()
-    status, message = await loop.run_in_executor(
-        _executor, 
-        _verify_email_sync, 
-        email, 
-        from_email
-    )
+    status, message = await _verify_email_async(email, from_email)
     
     return VerificationResult(
         email=email,
@@ -144,49 +467,115 @@ async def verify_email(email: str, from_email: str = None) -> VerificationResult
     )
 
 
-async def verify_emails_batch(emails: list, delay: float = None) -> list:
+async def _group_by_mx(emails: list) -> Tuple[Dict[Tuple[str, ...], List[Tuple[int, str]]],
+                                              Dict[int, Tuple[EmailVerificationStatus, str]]]:
     """
-    Verify a batch of emails with delay between each.
-    Returns list of VerificationResult objects.
+    Syntax-check every address and resolve each distinct domain's MX hosts concurrently.
+    Returns (groups, verdicts): groups map the MX hosts to try -> [(index, email)], and
+    verdicts hold the addresses already decided without SMTP, by input index.
     """
-    if delay is None:
-        delay = VERIFIER_DELAY_SECONDS
+    checked = [_precheck(email) for email in emails]
+    domains = list(dict.fromkeys(domain for _, domain, verdict in checked if verdict is None))
+    mx_lookups = await asyncio.gather(*(get_mx_records_async(domain) for domain in domains))
+    mx_by_domain = dict(zip(domains, mx_lookups))
     
+    groups = {}
+    verdicts = {}
+    for i, (email, domain, verdict) in enumerate(checked):
+        if verdict is None:
+            mx_hosts = mx_by_domain[domain]
+            if mx_hosts:
+                groups.setdefault(tuple(mx_hosts), []).append((i, email))
+                continue
+            verdict = _no_mx(domain)
+        verdicts[i] = verdict
+    return groups, verdicts
+
+
+async def _verify_group(mx_hosts: Tuple[str, ...], items: List[Tuple[int, str]], from_email: str,
+                        delay: float) -> List[Tuple[int, Tuple[EmailVerificationStatus, str]]]:
+    """Verify addresses sharing an MX back to back so they reuse one pooled session."""
     results = []
-    for i, email in enumerate(emails):
-        result = await verify_email(email)
-        results.append(result)
-        
-        # Add delay between verifications (except for the last one)
-        if i < len(emails) - 1:
+    for n, (i, email) in enumerate(items):
+        if n:
             await asyncio.sleep(delay)
-    
+        results.append((i, await _smtp_verify(email, list(mx_hosts), from_email)))
     return results
 
 
-def check_catch_all(domain: str, sample_size: int = 2) -> bool:
+async def verify_emails_batch(emails: list, delay: float = None, concurrency: int = None) -> list:
     """
-    Check if a domain is a catch-all (accepts any email).
-    Tests with random non-existent addresses.
+    Verify a batch of emails.
+    Duplicates (case/whitespace-insensitive) are verified once. Addresses are grouped by
+    destination MX so each group reuses one SMTP session and is paced by `delay`; up to
+    `concurrency` groups run at once.
+    Returns list of VerificationResult objects in input order.
     """
-    import random
-    import string
+    if delay is None:
+        delay = VERIFIER_DELAY_SECONDS
+    if concurrency is None:
+        concurrency = VERIFIER_CONCURRENCY
     
-    valid_count = 0
-    tried = 0
+    # Verify each distinct address once; merged lead lists often repeat them
+    keys = [email.strip().lower() for email in emails]
+    unique = list(dict.fromkeys(keys))
     
-    for _ in range(sample_size):
-        random_local = ''.join(random.choices(string.ascii_lowercase + string.digits, k=15))
-        test_email = f"{random_local}@{domain}"
-        status, _ = _verify_email_sync(test_email)
-        
-        if status == EmailVerificationStatus.VALID:
-            valid_count += 1
-        
-        tried += 1
-        time.sleep(1.0)
+    groups, outcomes = await _group_by_mx(unique)
+    sem = asyncio.Semaphore(concurrency)
+    
+    async def bounded(mx_hosts, items):
+        async with sem:
+            return await _verify_group(mx_hosts, items, VERIFIER_FROM_EMAIL, delay)
+    
+    for group_results in await asyncio.gather(*(bounded(mx, items) for mx, items in groups.items())):
+        outcomes.update(group_results)
     
-    return tried > 0 and valid_count == tried
+    position = {key: i for i, key in enumerate(unique)}
+    return [
+        VerificationResult(email=email, status=outcomes[position[key]][0], message=outcomes[position[key]][1])
+        for email, key in zip(emails, keys)
+    ]
+
+
+async def check_catch_all_async(domain: str, sample_size: int = 2,
+                                pool: Optional[SmtpConnectionPool] = None) -> bool:
+    """
+    Check if a domain is a catch-all (accepts any email).
+    Probes random non-existent addresses back to back on the pooled MX session,
+    stopping at the first one the server doesn't accept.
+    """
+    alphabet = string.ascii_lowercase + string.digits
+    for _ in range(sample_size):
+        test_email = f"{''.join(random.choices(alphabet, k=15))}@{domain}"
+        status, _ = await _verify_email_async(test_email, pool=pool)
+        if status != EmailVerificationStatus.VALID:
+            return False
+    return sample_size > 0
+
+
+def check_catch_all(domain: str, sample_size: int = 2) -> bool:
+    """
+    Synchronous wrapper around check_catch_all_async for callers outside an event loop.
+    Uses a private pool, closed before returning, so the shared pool (which belongs to
+    the app's event loop) is never touched from this loop or thread.
+    """
+    async def run() -> bool:
+        pool = SmtpConnectionPool()
+        try:
+            return await check_catch_all_async(domain, sample_size, pool)
+        finally:
+            pool.close()
+    return asyncio.run(run())
+
+
+def close_smtp_pool() -> None:
+    """Close the shared pool's idle SMTP sessions (called on app shutdown)."""
+    _pool.close()
+
+
+# How long a provider may run before the next one is started alongside it. Providers are
+# hedged rather than all raced at once so paid APIs are only called when earlier ones are slow.
+_PROVIDER_HEDGE_DELAY = 2.0
 
 
 class SmartEmailVerifier:
@@ -215,18 +604,23 @@ class SmartEmailVerifier:
         self.strategy = strategy
         self.providers = []
         
-        # Add providers based on configuration
+        # Add providers based on configuration; each is wrapped in a result cache
         if trumail_enabled:
-            self.providers.append(TrumailProvider())
+            self.providers.append(CachingProvider(TrumailProvider()))
         
         if hunter_api_key:
-            self.providers.append(HunterProvider(hunter_api_key))
+            self.providers.append(CachingProvider(HunterProvider(hunter_api_key)))
         
         if kickbox_api_key:
-            self.providers.append(KickboxProvider(kickbox_api_key))
+            self.providers.append(CachingProvider(KickboxProvider(kickbox_api_key)))
         
         if abstract_api_key:
-            self.providers.append(AbstractAPIProvider(abstract_api_key))
+            self.providers.append(CachingProvider(AbstractAPIProvider(abstract_api_key)))
+    
+    async def aclose(self):
+        """Close the providers' pooled HTTP clients."""
+        for provider in self.providers:
+            await provider.aclose()
     
     async def verify(self, email: str) -> VerificationResult:
         """
@@ -262,7 +656,7 @@ class SmartEmailVerifier:
             # Try catch-all detection
             if smtp_result.status == EmailVerificationStatus.VALID:
                 domain = email.split('@')[1]
-                is_catchall = check_catch_all(domain, sample_size=1)
+                is_catchall = await check_catch_all_async(domain, sample_size=1)
                 if is_catchall:
                     return VerificationResult(
                         email=email,
@@ -274,7 +668,7 @@ class SmartEmailVerifier:
     
     async def _verify_with_apis(self, email: str) -> VerificationResult:
         """
-        Try all configured API providers in sequence.
+        Try the configured API providers in order, hedging slow ones.
         Returns first definitive result.
         """
         if not self.providers:
@@ -285,23 +679,40 @@ class SmartEmailVerifier:
             )
         
         last_result = None
+        remaining = list(self.providers)
+        pending = {}
         
-        for provider in self.providers:
-            try:
-                result = await provider.verify(email)
-                
-                # If we get a definitive answer (VALID or INVALID), return it
-                if result.status in [EmailVerificationStatus.VALID, EmailVerificationStatus.INVALID]:
-                    return result
+        try:
+            while remaining or pending:
+                if remaining:
+                    provider = remaining.pop(0)
+                    pending[asyncio.create_task(provider.verify(email))] = provider
                 
-                # Keep catch-all results as backup
-                if result.status == EmailVerificationStatus.CATCH_ALL:
-                    last_result = result
+                # Hedge: if the running providers are slow, start the next one as well
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=_PROVIDER_HEDGE_DELAY if remaining else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
                 
-                # Otherwise continue to next provider
-            except Exception as e:
-                print(f"{provider.get_name()} verification failed: {e}")
-                continue
+                for task in done:
+                    provider = pending.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        logger.warning("%s verification failed: %s", provider.get_name(), e)
+                        continue
+                    
+                    # If we get a definitive answer (VALID or INVALID), return it
+                    if result.status in [EmailVerificationStatus.VALID, EmailVerificationStatus.INVALID]:
+                        return result
+                    
+                    # Keep catch-all results as backup
+                    if result.status == EmailVerificationStatus.CATCH_ALL:
+                        last_result = result
+        finally:
+            for task in pending:
+                task.cancel()
         
         # If no provider gave a definitive answer, return last result or unknown
         if last_result:
@@ -314,6 +725,38 @@ class SmartEmailVerifier:
         )
 
 
+# One SmartEmailVerifier (and provider set) per configuration. Configurations come from
+# settings, so there are only ever a few; they are kept until close_verifiers().
+_verifiers: Dict[Tuple[str, Optional[str], Optional[str], Optional[str]], SmartEmailVerifier] = {}
+
+
+def _get_verifier(
+    strategy: str,
+    hunter_api_key: str = None,
+    kickbox_api_key: str = None,
+    abstract_api_key: str = None
+) -> SmartEmailVerifier:
+    """Return the shared verifier for a configuration, creating it on first use."""
+    key = (strategy, hunter_api_key, kickbox_api_key, abstract_api_key)
+    verifier = _verifiers.get(key)
+    if verifier is None:
+        verifier = _verifiers[key] = SmartEmailVerifier(
+            strategy=strategy,
+            hunter_api_key=hunter_api_key,
+            kickbox_api_key=kickbox_api_key,
+            abstract_api_key=abstract_api_key
+        )
+    return verifier
+
+
+async def close_verifiers() -> None:
+    """Close the shared verifiers' HTTP clients (called on app shutdown)."""
+    verifiers = list(_verifiers.values())
+    _verifiers.clear()
+    for verifier in verifiers:
+        await verifier.aclose()
+
+
 # Convenience function for smart verification
 async def smart_verify_email(
     email: str,
@@ -325,10 +768,5 @@ async def smart_verify_email(
     """
     Verify email using smart strategy with multi-provider support.
     """
-    verifier = SmartEmailVerifier(
-        strategy=strategy,
-        hunter_api_key=hunter_api_key,
-        kickbox_api_key=kickbox_api_key,
-        abstract_api_key=abstract_api_key
-    )
+    verifier = _get_verifier(strategy, hunter_api_key, kickbox_api_key, abstract_api_key)
     return await verifier.verify(email)
@@ -1,12 +1,50 @@
 """
 Time utility module for timezone detection and optimal send time calculation.
 """
-from datetime import datetime, time, timedelta, date
-import pytz
-from typing import Optional, List, Tuple
+import sqlite3
+import threading
+from datetime import datetime, time, timedelta, date, timezone
+from functools import lru_cache
+from typing import Dict, Optional, List, Tuple
 from geopy.geocoders import Nominatim
 from timezonefinder import TimezoneFinder
-from ..config import DEFAULT_SEND_TIMEZONE, OPTIMAL_SEND_HOURS, OPTIMAL_SEND_DAYS
+from zoneinfo import ZoneInfo
+from ..config import DEFAULT_SEND_TIMEZONE, OPTIMAL_SEND_HOURS, OPTIMAL_SEND_DAYS, TIMEZONE_CACHE_FILE
+
+
+@lru_cache(maxsize=512)
+def _get_zone(tz_str: str) -> ZoneInfo:
+    """Return the ZoneInfo for an IANA name, built once per name."""
+    return ZoneInfo(tz_str)
+
+
+# Send windows are static config, so the next slot from any (weekday, hour) is precomputed
+_VALID_HOURS = tuple(sorted(OPTIMAL_SEND_HOURS))
+_VALID_DAYS = frozenset(OPTIMAL_SEND_DAYS)  # 0=Mon, 1=Tue... 6=Sun
+
+
+def _build_next_slots() -> Dict[Tuple[int, int], Tuple[int, int]]:
+    """Map (weekday, hour) -> (days ahead, send hour) of the next optimal slot."""
+    slots = {}
+    if not _VALID_HOURS:
+        return slots
+    for weekday in range(7):
+        for hour in range(24):
+            # A later hour today, if today is a send day
+            if weekday in _VALID_DAYS:
+                later_hours = [h for h in _VALID_HOURS if h > hour]
+                if later_hours:
+                    slots[(weekday, hour)] = (0, later_hours[0])
+                    continue
+            # Otherwise the first hour of the next send day
+            for days_ahead in range(1, 8):
+                if (weekday + days_ahead) % 7 in _VALID_DAYS:
+                    slots[(weekday, hour)] = (days_ahead, _VALID_HOURS[0])
+                    break
+    return slots
+
+
+_NEXT_SLOT = _build_next_slots()
 
 
 class TimeManager:
@@ -15,7 +53,14 @@ class TimeManager:
     def __init__(self):
         self.geolocator = Nominatim(user_agent="cold_outreach_app")
         self.tf = TimezoneFinder()
-        self.default_tz = pytz.timezone(DEFAULT_SEND_TIMEZONE)
+        self.default_tz = _get_zone(DEFAULT_SEND_TIMEZONE)
+        # Normalised city -> timezone. Geocoding is a rate-limited HTTPS call, so answers
+        # are kept in memory and in SQLite to survive restarts.
+        self._db_lock = threading.Lock()
+        self._db = sqlite3.connect(str(TIMEZONE_CACHE_FILE), check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS city_timezones (city TEXT PRIMARY KEY, timezone TEXT)")
+        self._db.commit()
+        self._tz_cache: Dict[str, str] = dict(self._db.execute("SELECT city, timezone FROM city_timezones"))
 
     def get_timezone_for_city(self, city: str) -> str:
         """
@@ -24,20 +69,36 @@ class TimeManager:
         """
         if not city:
             return DEFAULT_SEND_TIMEZONE
+        
+        key = city.strip().lower()
+        tz_str = self._tz_cache.get(key)
+        if tz_str is not None:
+            return tz_str
             
         try:
             # Geocode city
             location = self.geolocator.geocode(city)
-            if not location:
-                return DEFAULT_SEND_TIMEZONE
-                
-            # Get timezone from coordinates
-            tz_str = self.tf.timezone_at(lng=location.longitude, lat=location.latitude)
-            return tz_str if tz_str else DEFAULT_SEND_TIMEZONE
+            if location:
+                # Get timezone from coordinates
+                tz_str = self.tf.timezone_at(lng=location.longitude, lat=location.latitude)
             
         except Exception as e:
+            # Network/service errors are not cached so the next call retries
             print(f"Error getting timezone for {city}: {e}")
             return DEFAULT_SEND_TIMEZONE
+        
+        tz_str = tz_str or DEFAULT_SEND_TIMEZONE
+        self._remember_timezone(key, tz_str)
+        return tz_str
+
+    def _remember_timezone(self, key: str, tz_str: str):
+        """Cache a city's timezone in memory and on disk."""
+        self._tz_cache[key] = tz_str
+        try:
+            with self._db_lock, self._db:
+                self._db.execute("INSERT OR REPLACE INTO city_timezones VALUES (?, ?)", (key, tz_str))
+        except sqlite3.Error as e:
+            print(f"Error saving timezone cache for {key}: {e}")
 
     def get_optimal_send_time(self, city: str = None) -> datetime:
         """
@@ -45,39 +106,26 @@ class TimeManager:
         Optimal times: Tue-Thu, 10am or 2pm local time.
         """
         tz_str = self.get_timezone_for_city(city)
-        local_tz = pytz.timezone(tz_str)
+        local_tz = _get_zone(tz_str)
         now_local = datetime.now(local_tz)
         
-        # Sort optimal hours and days
-        valid_hours = sorted(OPTIMAL_SEND_HOURS)
-        valid_days = sorted(OPTIMAL_SEND_DAYS) # 0=Mon, 1=Tue... 6=Sun
+        slot = _NEXT_SLOT.get((now_local.weekday(), now_local.hour))
+        if slot is None:
+            # Fallback (no send days/hours configured)
+            return now_local + timedelta(hours=24)
         
-        # Try to find a time today
-        if now_local.weekday() in valid_days:
-            for h in valid_hours:
-                candidate = now_local.replace(hour=h, minute=0, second=0, microsecond=0)
-                if candidate > now_local:
-                    return candidate
+        days_ahead, hour = slot
+        if days_ahead == 0:
+            return now_local.replace(hour=hour, minute=0, second=0, microsecond=0)
         
-        # Look forward for next days
-        current_date = now_local.date()
-        for i in range(1, 14): # Look ahead 2 weeks max
-            next_date = current_date + timedelta(days=i)
-            if next_date.weekday() in valid_days:
-                # Found a valid day, use first valid hour
-                first_hour = valid_hours[0]
-                optimal_time = datetime.combine(next_date, time(hour=first_hour))
-                optimal_time = local_tz.localize(optimal_time)
-                return optimal_time
-                
-        # Fallback (shouldn't happen given logic above)
-        return now_local + timedelta(hours=24)
+        next_date = now_local.date() + timedelta(days=days_ahead)
+        return datetime.combine(next_date, time(hour=hour), tzinfo=local_tz)
 
     def to_utc(self, dt: datetime) -> datetime:
         """Convert any datetime to UTC."""
         if dt.tzinfo is None:
-            dt = self.default_tz.localize(dt)
-        return dt.astimezone(pytz.UTC)
+            dt = dt.replace(tzinfo=self.default_tz)
+        return dt.astimezone(timezone.utc)
 
 # Global instance
 time_manager = TimeManager()
@@ -4,15 +4,70 @@ Supports multiple email verification services with fallback logic.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 import httpx
 import asyncio
+import time
 from ..models import EmailVerificationStatus, VerificationResult
 
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    _HTTP2 = True
+except ImportError:  # pragma: no cover - h2 is optional
+    _HTTP2 = False
+
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=200)
+
+
+def close_stale_client(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Close a pooled client that was built on another event loop.
+    Its connections can only be closed from their own loop, so if that loop is still
+    running (in another thread) aclose() is scheduled there. A loop that has stopped can't
+    run aclose() ("Event loop is closed"); dropping the client then releases its sockets
+    through the transports' finalizers.
+    """
+    if loop is not None and loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
 
 class EmailVerificationProvider(ABC):
     """Abstract base class for email verification providers."""
     
+    _client: Optional[httpx.AsyncClient] = None
+    _client_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Pooled HTTP client reused across verify() calls, so keep-alive connections
+        skip the TCP/TLS handshake. Rebuilt if used from a different event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            if self._client is not None:
+                close_stale_client(self._client, self._client_loop)
+            self._client = httpx.AsyncClient(timeout=15.0, limits=_HTTP_LIMITS, http2=_HTTP2)
+            self._client_loop = loop
+        return self._client
+    
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            if self._client_loop is asyncio.get_running_loop():
+                await self._client.aclose()
+            else:
+                close_stale_client(self._client, self._client_loop)
+            self._client = None
+            self._client_loop = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
     @abstractmethod
     async def verify(self, email: str) -> VerificationResult:
         """Verify an email address."""
@@ -22,6 +77,148 @@ class EmailVerificationProvider(ABC):
     def get_name(self) -> str:
         """Get provider name."""
         pass
+    
+    async def verify_many(self, emails: List[str], concurrency: int = 50) -> List[VerificationResult]:
+        """
+        Verify several emails concurrently, at most `concurrency` requests in flight.
+        Requests share the pooled client's keep-alive connections. Results are in input order.
+        """
+        sem = asyncio.Semaphore(concurrency)
+        
+        async def verify_one(email: str) -> VerificationResult:
+            async with sem:
+                return await self.verify(email)
+        
+        return list(await asyncio.gather(*(verify_one(email) for email in emails)))
+    
+    def buffered(self, max_batch: int = 64, flush_interval: float = 0.02,
+                 concurrency: int = 50) -> "BufferedVerifier":
+        """Return a BufferedVerifier that coalesces submit() calls into verify_many batches."""
+        return BufferedVerifier(self, max_batch, flush_interval, concurrency)
+
+
+class BufferedVerifier:
+    """
+    Micro-batching front end for a provider.
+    
+    Usage:
+        async with provider.buffered() as buffer:
+            results = await asyncio.gather(*(buffer.submit(email) for email in emails))
+    
+    Submitted emails are held until `max_batch` are waiting or `flush_interval` seconds
+    have passed since the first one, then dispatched together through verify_many.
+    Leaving the context flushes and waits for everything still pending.
+    """
+    
+    def __init__(self, provider: EmailVerificationProvider, max_batch: int = 64,
+                 flush_interval: float = 0.02, concurrency: int = 50):
+        self.provider = provider
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.concurrency = concurrency
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._batches = set()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        self._flush()
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+    
+    async def submit(self, email: str) -> VerificationResult:
+        """Queue an email and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((email, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_timer is None:
+            self._flush_timer = loop.call_later(self.flush_interval, self._flush)
+        return await future
+    
+    def _flush(self):
+        """Dispatch everything pending as one batch."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._dispatch(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+    
+    async def _dispatch(self, batch: List[Tuple[str, asyncio.Future]]):
+        try:
+            results = await self.provider.verify_many([email for email, _ in batch], self.concurrency)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+# Only definitive answers are cached; UNKNOWN usually means an API/network error worth retrying
+_CACHEABLE_STATUSES = frozenset((
+    EmailVerificationStatus.VALID,
+    EmailVerificationStatus.INVALID,
+    EmailVerificationStatus.CATCH_ALL,
+))
+
+
+class CachingProvider(EmailVerificationProvider):
+    """
+    LRU + TTL result cache in front of another provider, keyed by normalised email.
+    Concurrent lookups of the same email share one upstream request.
+    """
+    
+    def __init__(self, inner: EmailVerificationProvider, maxsize: int = 50_000, ttl: float = 24 * 3600):
+        self.inner = inner
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._cache: "OrderedDict[str, Tuple[float, VerificationResult]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+    
+    async def verify(self, email: str) -> VerificationResult:
+        """Serve from cache when fresh, otherwise ask the wrapped provider (once per email)."""
+        key = email.strip().lower()
+        cached = self._cache.get(key)
+        if cached is not None:
+            expires_at, result = cached
+            if expires_at > time.monotonic():
+                self._cache.move_to_end(key)
+                return result if result.email == email else result.model_copy(update={'email': email})
+            del self._cache[key]
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, email))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one caller giving up doesn't cancel the request for the others
+        result = await asyncio.shield(task)
+        return result if result.email == email else result.model_copy(update={'email': email})
+    
+    async def _fetch(self, key: str, email: str) -> VerificationResult:
+        result = await self.inner.verify(email)
+        if result.status in _CACHEABLE_STATUSES:
+            self._cache[key] = (time.monotonic() + self.ttl, result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return result
+    
+    def get_name(self) -> str:
+        return self.inner.get_name()
+    
+    async def aclose(self):
+        await self.inner.aclose()
 
 
 class TrumailProvider(EmailVerificationProvider):
@@ -33,48 +230,48 @@ class TrumailProvider(EmailVerificationProvider):
     async def verify(self, email: str) -> VerificationResult:
         """Verify email using Trumail API."""
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                params = {"email": email}
-                response = await client.get(self.api_url, params=params)
+            client = self.client
+            params = {"email": email}
+            response = await client.get(self.api_url, params=params)
+            
+            if response.status_code == 200:
+                data = response.json()
+                
+                # Parse Trumail response
+                deliverable = data.get('deliverable', False)
+                full_inbox = data.get('fullInbox', False)
+                catch_all = data.get('catchAll', False)
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # Parse Trumail response
-                    deliverable = data.get('deliverable', False)
-                    full_inbox = data.get('fullInbox', False)
-                    catch_all = data.get('catchAll', False)
-                    
-                    if deliverable and not full_inbox:
-                        return VerificationResult(
-                            email=email,
-                            status=EmailVerificationStatus.VALID,
-                            message="Trumail: Email is deliverable"
-                        )
-                    elif catch_all:
-                        return VerificationResult(
-                            email=email,
-                            status=EmailVerificationStatus.CATCH_ALL,
-                            message="Trumail: Domain is catch-all"
-                        )
-                    elif full_inbox:
-                        return VerificationResult(
-                            email=email,
-                            status=EmailVerificationStatus.INVALID,
-                            message="Trumail: Mailbox is full"
-                        )
-                    else:
-                        return VerificationResult(
-                            email=email,
-                            status=EmailVerificationStatus.INVALID,
-                            message="Trumail: Email not deliverable"
-                        )
+                if deliverable and not full_inbox:
+                    return VerificationResult(
+                        email=email,
+                        status=EmailVerificationStatus.VALID,
+                        message="Trumail: Email is deliverable"
+                    )
+                elif catch_all:
+                    return VerificationResult(
+                        email=email,
+                        status=EmailVerificationStatus.CATCH_ALL,
+                        message="Trumail: Domain is catch-all"
+                    )
+                elif full_inbox:
+                    return VerificationResult(
+                        email=email,
+                        status=EmailVerificationStatus.INVALID,
+                        message="Trumail: Mailbox is full"
+                    )
                 else:
                     return VerificationResult(
                         email=email,
-                        status=EmailVerificationStatus.UNKNOWN,
-                        message=f"Trumail API error: {response.status_code}"
+                        status=EmailVerificationStatus.INVALID,
+                        message="Trumail: Email not deliverable"
                     )
+            else:
+                return VerificationResult(
+                    email=email,
+                    status=EmailVerificationStatus.UNKNOWN,
+                    message=f"Trumail API error: {response.status_code}"
+                )
         except Exception as e:
             return VerificationResult(
                 email=email,
@@ -103,57 +300,57 @@ class HunterProvider(EmailVerificationProvider):
             )
         
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                params = {
-                    "email": email,
-                    "api_key": self.api_key
-                }
-                response = await client.get(self.api_url, params=params)
+            client = self.client
+            params = {
+                "email": email,
+                "api_key": self.api_key
+            }
+            response = await client.get(self.api_url, params=params)
+            
+            if response.status_code == 200:
+                data = response.json()
+                result = data.get('data', {})
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    result = data.get('data', {})
-                    
-                    status_text = result.get('status', 'unknown')
-                    score = result.get('score', 0)
-                    
-                    # Hunter returns: valid, invalid, accept_all, unknown, webmail, disposable, etc.
-                    if status_text == 'valid' or score >= 80:
-                        return VerificationResult(
-                            email=email,
-                            status=EmailVerificationStatus.VALID,
-                            message=f"Hunter.io: Valid (score: {score})"
-                        )
-                    elif status_text == 'accept_all':
-                        return VerificationResult(
-                            email=email,
-                            status=EmailVerificationStatus.CATCH_ALL,
-                            message="Hunter.io: Accept-all domain"
-                        )
-                    elif status_text == 'invalid' or score < 30:
-                        return VerificationResult(
-                            email=email,
-                            status=EmailVerificationStatus.INVALID,
-                            message=f"Hunter.io: Invalid (score: {score})"
-                        )
-                    else:
-                        return VerificationResult(
-                            email=email,
-                            status=EmailVerificationStatus.UNKNOWN,
-                            message=f"Hunter.io: {status_text} (score: {score})"
-                        )
-                elif response.status_code == 401:
+                status_text = result.get('status', 'unknown')
+                score = result.get('score', 0)
+                
+                # Hunter returns: valid, invalid, accept_all, unknown, webmail, disposable, etc.
+                if status_text == 'valid' or score >= 80:
                     return VerificationResult(
                         email=email,
-                        status=EmailVerificationStatus.UNKNOWN,
-                        message="Hunter.io: Invalid API key"
+                        status=EmailVerificationStatus.VALID,
+                        message=f"Hunter.io: Valid (score: {score})"
+                    )
+                elif status_text == 'accept_all':
+                    return VerificationResult(
+                        email=email,
+                        status=EmailVerificationStatus.CATCH_ALL,
+                        message="Hunter.io: Accept-all domain"
+                    )
+                elif status_text == 'invalid' or score < 30:
+                    return VerificationResult(
+                        email=email,
+                        status=EmailVerificationStatus.INVALID,
+                        message=f"Hunter.io: Invalid (score: {score})"
                     )
                 else:
                     return VerificationResult(
                         email=email,
                         status=EmailVerificationStatus.UNKNOWN,
-                        message=f"Hunter.io API error: {response.status_code}"
+                        message=f"Hunter.io: {status_text} (score: {score})"
                     )
+            elif response.status_code == 401:
+                return VerificationResult(
+                    email=email,
+                    status=EmailVerificationStatus.UNKNOWN,
+                    message="Hunter.io: Invalid API key"
+                )
+            else:
+                return VerificationResult(
+                    email=email,
+                    status=EmailVerificationStatus.UNKNOWN,
+                    message=f"Hunter.io API error: {response.status_code}"
+                )
         except Exception as e:
             return VerificationResult(
                 email=email,
@@ -182,50 +379,50 @@ class KickboxProvider(EmailVerificationProvider):
             )
         
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                params = {
-                    "email": email,
-                    "apikey": self.api_key
-                }
-                response = await client.get(self.api_url, params=params)
+            client = self.client
+            params = {
+                "email": email,
+                "apikey": self.api_key
+            }
+            response = await client.get(self.api_url, params=params)
+            
+            if response.status_code == 200:
+                data = response.json()
+                
+                result_status = data.get('result', 'unknown')
+                reason = data.get('reason', '')
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    result_status = data.get('result', 'unknown')
-                    reason = data.get('reason', '')
-                    
-                    # Kickbox returns: deliverable, undeliverable, risky, unknown
-                    if result_status == 'deliverable':
-                        return VerificationResult(
-                            email=email,
-                            status=EmailVerificationStatus.VALID,
-                            message=f"Kickbox: Deliverable ({reason})"
-                        )
-                    elif result_status == 'undeliverable':
-                        return VerificationResult(
-                            email=email,
-                            status=EmailVerificationStatus.INVALID,
-                            message=f"Kickbox: Undeliverable ({reason})"
-                        )
-                    elif result_status == 'risky' and reason == 'accept_all':
-                        return VerificationResult(
-                            email=email,
-                            status=EmailVerificationStatus.CATCH_ALL,
-                            message="Kickbox: Risky - Accept-all domain"
-                        )
-                    else:
-                        return VerificationResult(
-                            email=email,
-                            status=EmailVerificationStatus.UNKNOWN,
-                            message=f"Kickbox: {result_status} ({reason})"
-                        )
+                # Kickbox returns: deliverable, undeliverable, risky, unknown
+                if result_status == 'deliverable':
+                    return VerificationResult(
+                        email=email,
+                        status=EmailVerificationStatus.VALID,
+                        message=f"Kickbox: Deliverable ({reason})"
+                    )
+                elif result_status == 'undeliverable':
+                    return VerificationResult(
+                        email=email,
+                        status=EmailVerificationStatus.INVALID,
+                        message=f"Kickbox: Undeliverable ({reason})"
+                    )
+                elif result_status == 'risky' and reason == 'accept_all':
+                    return VerificationResult(
+                        email=email,
+                        status=EmailVerificationStatus.CATCH_ALL,
+                        message="Kickbox: Risky - Accept-all domain"
+                    )
                 else:
                     return VerificationResult(
                         email=email,
                         status=EmailVerificationStatus.UNKNOWN,
-                        message=f"Kickbox API error: {response.status_code}"
+                        message=f"Kickbox: {result_status} ({reason})"
                     )
+            else:
+                return VerificationResult(
+                    email=email,
+                    status=EmailVerificationStatus.UNKNOWN,
+                    message=f"Kickbox API error: {response.status_code}"
+                )
         except Exception as e:
             return VerificationResult(
                 email=email,
@@ -254,51 +451,51 @@ class AbstractAPIProvider(EmailVerificationProvider):
             )
         
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                params = {
-                    "api_key": self.api_key,
-                    "email": email
-                }
-                response = await client.get(self.api_url, params=params)
+            client = self.client
+            params = {
+                "api_key": self.api_key,
+                "email": email
+            }
+            response = await client.get(self.api_url, params=params)
+            
+            if response.status_code == 200:
+                data = response.json()
+                
+                is_valid_format = data.get('is_valid_format', {}).get('value', False)
+                is_smtp_valid = data.get('is_smtp_valid', {}).get('value', False)
+                is_catchall = data.get('is_catchall_email', {}).get('value', False)
+                deliverability = data.get('deliverability', 'UNKNOWN')
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    is_valid_format = data.get('is_valid_format', {}).get('value', False)
-                    is_smtp_valid = data.get('is_smtp_valid', {}).get('value', False)
-                    is_catchall = data.get('is_catchall_email', {}).get('value', False)
-                    deliverability = data.get('deliverability', 'UNKNOWN')
-                    
-                    if deliverability == 'DELIVERABLE' and is_valid_format and is_smtp_valid:
-                        return VerificationResult(
-                            email=email,
-                            status=EmailVerificationStatus.VALID,
-                            message="AbstractAPI: Deliverable"
-                        )
-                    elif is_catchall:
-                        return VerificationResult(
-                            email=email,
-                            status=EmailVerificationStatus.CATCH_ALL,
-                            message="AbstractAPI: Catch-all domain"
-                        )
-                    elif deliverability == 'UNDELIVERABLE':
-                        return VerificationResult(
-                            email=email,
-                            status=EmailVerificationStatus.INVALID,
-                            message="AbstractAPI: Undeliverable"
-                        )
-                    else:
-                        return VerificationResult(
-                            email=email,
-                            status=EmailVerificationStatus.UNKNOWN,
-                            message=f"AbstractAPI: {deliverability}"
-                        )
+                if deliverability == 'DELIVERABLE' and is_valid_format and is_smtp_valid:
+                    return VerificationResult(
+                        email=email,
+                        status=EmailVerificationStatus.VALID,
+                        message="AbstractAPI: Deliverable"
+                    )
+                elif is_catchall:
+                    return VerificationResult(
+                        email=email,
+                        status=EmailVerificationStatus.CATCH_ALL,
+                        message="AbstractAPI: Catch-all domain"
+                    )
+                elif deliverability == 'UNDELIVERABLE':
+                    return VerificationResult(
+                        email=email,
+                        status=EmailVerificationStatus.INVALID,
+                        message="AbstractAPI: Undeliverable"
+                    )
                 else:
                     return VerificationResult(
                         email=email,
                         status=EmailVerificationStatus.UNKNOWN,
-                        message=f"AbstractAPI error: {response.status_code}"
+                        message=f"AbstractAPI: {deliverability}"
                     )
+            else:
+                return VerificationResult(
+                    email=email,
+                    status=EmailVerificationStatus.UNKNOWN,
+                    message=f"AbstractAPI error: {response.status_code}"
+                )
         except Exception as e:
             return VerificationResult(
                 email=email,
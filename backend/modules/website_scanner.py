@@ -4,28 +4,246 @@ Scans websites for technical SEO, content availability, contact information, and
 """
 
 import asyncio
+import codecs
+import sqlite3
+import threading
 import time
 import httpx
 from bs4 import BeautifulSoup
+from bs4.dammit import EncodingDetector
+from lxml import etree, html as lxml_html
+from lxml.html import soupparser
 from typing import Dict, Any, Optional, List, Set, Tuple
 import re
-from urllib.parse import urljoin, urlparse
+from pathlib import Path
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit
 
+from ..config import WEBSITE_SCAN_CACHE_FILE, WEBSITE_SCAN_CACHE_TTL
 from ..models import WebsiteScanResult
 from .audit_report import AuditReportGenerator
+from .verification_providers import close_stale_client
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    _HTTP2 = True
+except ImportError:  # pragma: no cover - h2 is optional
+    _HTTP2 = False
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - pyahocorasick is optional
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:  # pragma: no cover - google-re2 is optional
+    re2 = None
+
+# The text nodes BeautifulSoup's get_text() returns: script/style/template bodies,
+# ruby annotations and comments are skipped.
+_VISIBLE_TEXT = etree.XPath(
+    './/text()[not(ancestor::script or ancestor::style or ancestor::template'
+    ' or ancestor::rt or ancestor::rp)]',
+    smart_strings=False
+)
+_LINK_HREFS = etree.XPath('//a/@href', smart_strings=False)
+_NON_TEXT_TAGS = ('script', 'style', 'template', 'rt', 'rp')
+
+
+def _stripped_text(element: lxml_html.HtmlElement) -> str:
+    """Equivalent of BeautifulSoup's get_text(strip=True) for an lxml element."""
+    return ''.join(text.strip() for text in _VISIBLE_TEXT(element))
+
+
+def _visible_text(tree: lxml_html.HtmlElement) -> str:
+    """
+    Whole-page equivalent of BeautifulSoup's get_text(), concatenated in C by text_content().
+    Removes script/style/template elements and ruby annotations from the tree to do so,
+    so run it after every other lookup on the tree.
+    """
+    etree.strip_elements(tree, *_NON_TEXT_TAGS, with_tail=False)
+    return tree.text_content()
+
+
+# Terms that mark each content section, matched against lowercased links and page text
+_CONTENT_KEYWORDS = {
+    'has_projects': ['project', 'portfolio', 'gallery', 'our work', 'case study', 'examples'],
+    'has_testimonials': ['testimonial', 'review', 'what our clients say', 'feedback', 'stories'],
+    'has_license': ['license', 'licence', 'insured', 'bonded', '#', 'registration'],
+    'has_about': ['about us', 'our team', 'who we are', 'meet the team', 'story'],
+    'has_services': ['services', 'what we do', 'offerings', 'solutions'],
+    'has_social_links': ['facebook.com', 'instagram.com', 'linkedin.com', 'twitter.com', 'youtube.com']
+}
+
+
+def _build_term_keys() -> Dict[str, Tuple[str, ...]]:
+    """Invert _CONTENT_KEYWORDS: each term mapped to the sections it marks."""
+    term_keys: Dict[str, Tuple[str, ...]] = {}
+    for key, terms in _CONTENT_KEYWORDS.items():
+        for term in terms:
+            term_keys[term] = term_keys.get(term, ()) + (key,)
+    return term_keys
+
+
+_CONTENT_TERM_KEYS = _build_term_keys()
+
+
+def _build_keyword_automaton():
+    """Aho-Corasick automaton over _CONTENT_TERM_KEYS (None without pyahocorasick)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for term, keys in _CONTENT_TERM_KEYS.items():
+        automaton.add_word(term, keys)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+# Platform fingerprints in priority order: when several match, the first listed wins
+_PLATFORM_SIGNATURES = {
+    'WordPress': ['wordpress', 'wp-content'],
+    'Wix': ['wix'],
+    'Squarespace': ['squarespace'],
+    'Shopify': ['shopify'],
+    'React/Next.js': ['react', 'next.js'],
+    'Laravel': ['laravel']
+}
+_PLATFORMS = tuple(_PLATFORM_SIGNATURES)
+_PLATFORM_SCAN_CHUNK = 64 * 1024
+_PLATFORM_TERM_OVERLAP = max(len(term) for terms in _PLATFORM_SIGNATURES.values() for term in terms) - 1
+
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=200)
+
+# Only the first part of a page is read; title/meta/viewport live near the top and this
+# bounds memory and parse time on huge or mislabelled responses
+_MAX_PAGE_BYTES = 2_000_000
+_READ_CHUNK_BYTES = 64 * 1024
+_HTML_CONTENT_TYPES = ('text/', 'application/xhtml+xml')
+
+
+def _is_html(content_type: str) -> bool:
+    """Whether a Content-Type header allows an HTML body (a missing header is given the benefit of the doubt)."""
+    return not content_type or content_type.lower().startswith(_HTML_CONTENT_TYPES)
+
+
+# Leading bytes of formats that get served with a missing or wrong text/* Content-Type
+_BINARY_SIGNATURES = (
+    b'%PDF-', b'PK\x03\x04', b'\x89PNG', b'GIF8', b'\xff\xd8\xff', b'\x1f\x8b',
+    b'Rar!', b'7z\xbc\xaf', b'\x7fELF', b'OggS', b'ID3'
+)
+_UTF16_32_BOMS = (b'\xff\xfe', b'\xfe\xff', b'\x00\x00\xfe\xff')
+
+
+def _looks_binary(content: bytes) -> bool:
+    """Sniff the start of a body: known binary magic numbers, or NUL bytes in what isn't UTF-16/32 text."""
+    head = content[:1024].lstrip()
+    if head.startswith(_BINARY_SIGNATURES):
+        return True
+    return b'\x00' in head and not head.startswith(_UTF16_32_BOMS)
+
+
+def _declared_charset(content: bytes) -> Optional[str]:
+    """The charset a page declares in its <meta> tag (or XML declaration), if Python has a codec for it."""
+    declared = EncodingDetector.find_declared_encoding(content, is_html=True)
+    if not declared:
+        return None
+    try:
+        return codecs.lookup(declared).name
+    except LookupError:
+        return None
+
+
+def _cache_key(url: str) -> str:
+    """Normalise a URL for the scan cache: lowercase scheme and host, no fragment, '/' for an empty path."""
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', parts.query, ''))
+
+# Basic email extraction pattern; RE2 runs it as a linear-time DFA when available
+_EMAIL_RE = (re2 or re).compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+# Common false positives: image and asset file names that look like addresses
+_ASSET_EXT_RE = re.compile(r'\.(?:png|jpg|jpeg|gif|svg|webp|js|css)', re.IGNORECASE)
+
 
 class WebsiteScanner:
     """Scans websites for various metrics and content."""
     
-    def __init__(self, timeout: float = 15.0):
+    _client: Optional[httpx.AsyncClient] = None
+    _client_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def __init__(self, timeout: float = 15.0, cache_file: Optional[Path] = WEBSITE_SCAN_CACHE_FILE,
+                 cache_ttl: float = WEBSITE_SCAN_CACHE_TTL):
         self.timeout = timeout
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        # Successful scans are kept in SQLite for `cache_ttl` seconds, so rescanning a URL
+        # (or restarting the app) doesn't refetch and reparse the site
+        self.cache_ttl = cache_ttl
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._db_lock = threading.Lock()
+        self._db = None
+        if cache_file is not None and cache_ttl > 0:
+            self._db = sqlite3.connect(str(cache_file), check_same_thread=False)
+            with self._db:
+                self._db.execute("CREATE TABLE IF NOT EXISTS website_scans (url TEXT PRIMARY KEY, scanned_at REAL, result TEXT)")
+                self._db.execute("DELETE FROM website_scans WHERE scanned_at < ?", (time.time() - cache_ttl,))
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Pooled HTTP client shared by every scan, so redirects and about-page probes
+        reuse keep-alive connections. Rebuilt if used from a different event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            if self._client is not None:
+                close_stale_client(self._client, self._client_loop)
+            self._client = httpx.AsyncClient(
+                verify=False, follow_redirects=True, timeout=self.timeout,
+                limits=_HTTP_LIMITS, http2=_HTTP2
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self):
+        """Close the pooled HTTP client and the scan cache (later scans run uncached)."""
+        if self._client is not None:
+            if self._client_loop is asyncio.get_running_loop():
+                await self._client.aclose()
+            else:
+                close_stale_client(self._client, self._client_loop)
+            self._client = None
+            self._client_loop = None
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+                self._db = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def scan_many(self, urls: List[str], concurrency: int = 10) -> List[WebsiteScanResult]:
+        """
+        Scan several websites concurrently, at most `concurrency` at a time.
+        Results are in input order.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def scan_one(url: str) -> WebsiteScanResult:
+            async with sem:
+                return await self.scan(url)
+
+        return list(await asyncio.gather(*(scan_one(url) for url in urls)))
 
     async def scan(self, url: str) -> WebsiteScanResult:
         """
         Scans a single website and returns the results.
+        Recent successful scans of the same URL are served from the cache.
         """
         if not url:
              return WebsiteScanResult(
@@ -36,71 +254,131 @@ class WebsiteScanner:
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
 
-        start_time = time.time()
+        key = _cache_key(url)
+        if self._db is not None:
+            # SQLite reads block, so the lookup runs in a worker thread like the parsing does
+            cached = await asyncio.to_thread(self._cached_scan, key)
+            if cached is not None:
+                return cached
+
+        # Concurrent scans of the same URL share one fetch
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._scan_and_remember(key, url))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one caller giving up doesn't cancel the scan for the others
+        return await asyncio.shield(task)
+
+    def _cached_scan(self, key: str) -> Optional[WebsiteScanResult]:
+        """Return the stored scan for a URL if it is younger than cache_ttl (blocking; run in a worker thread)."""
         try:
-            async with httpx.AsyncClient(verify=False, follow_redirects=True, timeout=self.timeout) as client:
-                response = await client.get(url, headers=self.headers)
-                # We don't raise for status immediately to allow analyzing error pages if needed, 
-                # but generally we want successful loads.
-                if response.status_code >= 400:
-                    return WebsiteScanResult(
-                        url=url,
-                        summary=f"Website returned status {response.status_code}"
-                    )
-                
-                # Measure response time
-                response_time_ms = int((time.time() - start_time) * 1000)
-                
-                # Parse content
-                soup = BeautifulSoup(response.content, 'lxml')
-                
-                # Technical Audit
-                tech_audit = self._audit_technical(soup, response)
-                
-                # Content Check
-                content_audit = self._audit_content(soup)
-                
-                # Contact/Email finding
-                emails = self._find_emails(response.text)
-                
-                # Decision maker identification
-                decision_makers = await self._find_decision_makers(url, client)
-                
-                # Generate summary
-                summary = self._generate_summary(tech_audit, content_audit, emails, decision_makers)
-                
-                # Prepare full audit data
-                audit_data = {
-                    'technical': tech_audit,
-                    'content': content_audit,
-                    'emails_found': list(emails),
-                    'decision_makers': decision_makers
-                }
-                
-                # Generate audit report
-                report_paths = None
-                try:
-                    report_gen = AuditReportGenerator()
-                    report_paths = report_gen.generate_report(
-                        url=str(response.url),
-                        audit_data=audit_data,
-                        decision_makers=decision_makers,
-                        format="both"
+            with self._db_lock:
+                if self._db is None:
+                    return None
+                row = self._db.execute(
+                    "SELECT scanned_at, result FROM website_scans WHERE url = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error reading website scan cache for {key}: {e}")
+            return None
+        if row is None or time.time() - row[0] >= self.cache_ttl:
+            return None
+        return WebsiteScanResult.model_validate_json(row[1])
+
+    async def _scan_and_remember(self, key: str, url: str) -> WebsiteScanResult:
+        """Scan a URL and store the result; failed scans are not cached so they get retried."""
+        result = await self._scan(url)
+        if self._db is not None and result.audit_data is not None:
+            await asyncio.to_thread(self._remember_scan, key, result)
+        return result
+
+    def _remember_scan(self, key: str, result: WebsiteScanResult):
+        """Store a successful scan (blocking; run in a worker thread)."""
+        try:
+            with self._db_lock:
+                if self._db is None:
+                    return
+                with self._db:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO website_scans VALUES (?, ?, ?)",
+                        (key, time.time(), result.model_dump_json())
                     )
-                except Exception as e:
-                    print(f"Failed to generate audit report: {e}")
-                
+        except sqlite3.Error as e:
+            print(f"Error saving website scan cache for {key}: {e}")
+
+    async def _scan(self, url: str) -> WebsiteScanResult:
+        """Fetch, audit and report on a single (scheme-qualified) URL, bypassing the cache."""
+        start_time = time.time()
+        try:
+            client = self.client
+            response, content = await self._fetch(client, url, headers=self.headers)
+            # We don't raise for status immediately to allow analyzing error pages if needed, 
+            # but generally we want successful loads.
+            if response.status_code >= 400:
                 return WebsiteScanResult(
+                    url=url,
+                    summary=f"Website returned status {response.status_code}"
+                )
+            
+            content_type = response.headers.get('content-type', '')
+            if not _is_html(content_type):
+                return WebsiteScanResult(
+                    url=url,
+                    summary=f"Skipped: not an HTML page ({content_type.split(';')[0].strip()})"
+                )
+            if _looks_binary(content):
+                return WebsiteScanResult(
+                    url=url,
+                    summary="Skipped: not an HTML page (binary content)"
+                )
+            
+            # Measure response time
+            response_time_ms = int((time.time() - start_time) * 1000)
+            
+            # Parse and audit off the event loop so other scans keep making progress
+            tech_audit, content_audit, emails = await asyncio.to_thread(
+                self._parse_and_audit, content, response.charset_encoding, str(response.url)
+            )
+            
+            # Decision maker identification
+            decision_makers = await self._find_decision_makers(url, client)
+            
+            # Generate summary
+            summary = self._generate_summary(tech_audit, content_audit, emails, decision_makers)
+            
+            # Prepare full audit data
+            audit_data = {
+                'technical': tech_audit,
+                'content': content_audit,
+                'emails_found': list(emails),
+                'decision_makers': decision_makers
+            }
+            
+            # Generate audit report
+            report_paths = None
+            try:
+                report_gen = AuditReportGenerator()
+                report_paths = report_gen.generate_report(
                     url=str(response.url),
-                    title=tech_audit.get('title'),
-                    meta_description=tech_audit.get('meta_description'),
-                    response_time_ms=response_time_ms,
-                    platform=tech_audit.get('platform'),
-                    has_viewport_meta=tech_audit.get('has_viewport_meta', False),
                     audit_data=audit_data,
-                    summary=summary,
-                    audit_report_paths=report_paths
+                    decision_makers=decision_makers,
+                    format="both"
                 )
+            except Exception as e:
+                print(f"Failed to generate audit report: {e}")
+            
+            return WebsiteScanResult(
+                url=str(response.url),
+                title=tech_audit.get('title'),
+                meta_description=tech_audit.get('meta_description'),
+                response_time_ms=response_time_ms,
+                platform=tech_audit.get('platform'),
+                has_viewport_meta=tech_audit.get('has_viewport_meta', False),
+                audit_data=audit_data,
+                summary=summary,
+                audit_report_paths=report_paths
+            )
 
         except httpx.TimeoutException:
             return WebsiteScanResult(
@@ -118,110 +396,146 @@ class WebsiteScanner:
                 summary=f"Scan failed: {str(e)}"
             )
 
-    def _audit_technical(self, soup: BeautifulSoup, response: httpx.Response) -> Dict[str, Any]:
+    async def _fetch(self, client: httpx.AsyncClient, url: str, **kwargs) -> Tuple[httpx.Response, bytes]:
+        """
+        GET a page, streaming at most _MAX_PAGE_BYTES of its (decompressed) body.
+        Error responses and non-HTML content types are returned without reading the body,
+        and reading stops after the first chunk if that sniffs as binary.
+        """
+        chunks = []
+        async with client.stream('GET', url, **kwargs) as response:
+            if response.status_code < 400 and _is_html(response.headers.get('content-type', '')):
+                total = 0
+                async for chunk in response.aiter_bytes(_READ_CHUNK_BYTES):
+                    chunks.append(chunk)
+                    total += len(chunk)
+                    if total >= _MAX_PAGE_BYTES or (len(chunks) == 1 and _looks_binary(chunk)):
+                        break
+        return response, b''.join(chunks)[:_MAX_PAGE_BYTES]
+
+    def _parse_html(self, page: str, content: bytes) -> lxml_html.HtmlElement:
+        """
+        Parse the page with lxml directly.
+        Falls back to BeautifulSoup (via lxml's soupparser) for documents lxml rejects,
+        e.g. empty bodies or an XML encoding declaration.
+        """
+        try:
+            return lxml_html.document_fromstring(page)
+        except (etree.ParserError, ValueError):
+            return soupparser.fromstring(content, features='lxml')
+
+    def _parse_and_audit(self, content: bytes, charset: Optional[str], final_url: str) -> Tuple[Dict[str, Any], Dict[str, bool], Set[str]]:
+        """
+        Decode, parse and audit a fetched page. CPU-bound, so scan() runs it in a worker
+        thread; lxml releases the GIL while parsing, letting concurrent scans overlap.
+        A page whose Content-Type names no charset is decoded with its <meta> charset,
+        falling back to UTF-8.
+        """
+        # Parse content
+        encoding = charset or _declared_charset(content) or 'utf-8'
+        try:
+            page = content.decode(encoding, errors='replace')
+        except LookupError:
+            page = content.decode('utf-8', errors='replace')
+        tree = self._parse_html(page, content)
+        
+        # Technical Audit
+        tech_audit = self._audit_technical(tree, page, final_url)
+        
+        # Content Check (page text is extracted last: it strips non-text elements from the tree)
+        links = _LINK_HREFS(tree)
+        content_audit = self._audit_content(links, _visible_text(tree))
+        
+        # Contact/Email finding
+        emails = self._find_emails(page)
+        
+        return tech_audit, content_audit, emails
+
+    def _audit_technical(self, tree: lxml_html.HtmlElement, page: str, final_url: str) -> Dict[str, Any]:
         """Check technical aspects like TItle, Description, H1, Viewport."""
         audit = {}
         
         # Title
-        title_tag = soup.find('title')
-        audit['title'] = title_tag.get_text(strip=True) if title_tag else None
+        title_tag = tree.find('.//title')
+        audit['title'] = _stripped_text(title_tag) if title_tag is not None else None
         
         # Meta Description
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if not meta_desc:
-            meta_desc = soup.find('meta', attrs={'property': 'og:description'})
-        audit['meta_description'] = meta_desc.get('content', '').strip() if meta_desc else None
+        meta_desc = tree.find('.//meta[@name="description"]')
+        if meta_desc is None:
+            meta_desc = tree.find('.//meta[@property="og:description"]')
+        audit['meta_description'] = meta_desc.get('content', '').strip() if meta_desc is not None else None
         
         # H1
-        h1 = soup.find('h1')
-        audit['h1'] = h1.get_text(strip=True) if h1 else None
+        h1 = tree.find('.//h1')
+        audit['h1'] = _stripped_text(h1) if h1 is not None else None
         
         # Viewport (Mobile responsiveness indicator)
-        viewport = soup.find('meta', attrs={'name': 'viewport'})
-        audit['has_viewport_meta'] = bool(viewport)
+        viewport = tree.find('.//meta[@name="viewport"]')
+        audit['has_viewport_meta'] = viewport is not None
         
         # Server/Platform detection (basic)
-        headers = response.headers
-        
-        platform = "Unknown"
-        text_lower = response.text.lower()
-        
-        if 'wordpress' in text_lower or 'wp-content' in text_lower:
-             platform = "WordPress"
-        elif 'wix' in text_lower:
-            platform = "Wix"
-        elif 'squarespace' in text_lower:
-            platform = "Squarespace"
-        elif 'shopify' in text_lower:
-            platform = "Shopify"
-        elif 'react' in text_lower or 'next.js' in text_lower:
-            platform = "React/Next.js"
-        elif 'laravel' in text_lower:
-             platform = "Laravel"
-            
-        audit['platform'] = platform
+        audit['platform'] = self._detect_platform(page)
         
         # SSL Check
-        audit['ssl_enabled'] = str(response.url).startswith('https://')
+        audit['ssl_enabled'] = final_url.startswith('https://')
         
         # Structured Data Check (Schema.org)
-        structured_data = soup.find('script', type='application/ld+json')
-        audit['has_structured_data'] = bool(structured_data)
+        structured_data = tree.find('.//script[@type="application/ld+json"]')
+        audit['has_structured_data'] = structured_data is not None
         
         return audit
 
-    def _audit_content(self, soup: BeautifulSoup) -> Dict[str, bool]:
-        """Check for presence of specific content sections."""
-        text_content = soup.get_text().lower()
-        
-        keywords = {
-            'has_projects': ['project', 'portfolio', 'gallery', 'our work', 'case study', 'examples'],
-            'has_testimonials': ['testimonial', 'review', 'what our clients say', 'feedback', 'stories'],
-            'has_license': ['license', 'licence', 'insured', 'bonded', '#', 'registration'],
-            'has_about': ['about us', 'our team', 'who we are', 'meet the team', 'story'],
-            'has_services': ['services', 'what we do', 'offerings', 'solutions'],
-            'has_social_links': ['facebook.com', 'instagram.com', 'linkedin.com', 'twitter.com', 'youtube.com']
-        }
-        
-        audit = {}
-        # First check all links as they are most reliable for specific sections
-        links_href = set()
-        for link in soup.find_all('a', href=True):
-             links_href.add(link['href'].lower())
-             
-        for key, terms in keywords.items():
-            found = False
-            
-            # Check links first
-            for href in links_href:
-                if any(term in href for term in terms):
-                    found = True
+    def _detect_platform(self, page: str) -> str:
+        """
+        Identify the platform from fingerprints in the page source, ignoring case.
+        The page is lowercased a chunk at a time rather than copied whole, and the scan
+        stops once the highest-priority platform has been seen.
+        """
+        best = len(_PLATFORMS)
+        for start in range(0, len(page), _PLATFORM_SCAN_CHUNK):
+            # Chunks overlap by the longest term minus one so no fingerprint is split
+            chunk = page[start:start + _PLATFORM_SCAN_CHUNK + _PLATFORM_TERM_OVERLAP].lower()
+            for rank, terms in enumerate(_PLATFORM_SIGNATURES.values()):
+                if rank >= best:
                     break
+                if any(term in chunk for term in terms):
+                    best = rank
+                    break
+            if best == 0:
+                break
+        return _PLATFORMS[best] if best < len(_PLATFORMS) else "Unknown"
+
+    def _audit_content(self, links: List[str], text: str) -> Dict[str, bool]:
+        """Check for presence of specific content sections, given the page's link hrefs and visible text."""
+        # Links are the most reliable signal for specific sections and visible text is the
+        # fallback; a section counts if either mentions one of its terms, so search both at once.
+        # Terms never contain newlines, so a match cannot straddle two hrefs.
+        haystack = ('\n'.join(links) + '\n' + text).lower()
+        
+        # Both paths stop as soon as every section has been found
+        missing = set(_CONTENT_KEYWORDS)
+        if _KEYWORD_AUTOMATON is not None:
+            # Single pass over the page for every term
+            for _, keys in _KEYWORD_AUTOMATON.iter(haystack):
+                missing.difference_update(keys)
+                if not missing:
+                    break
+        else:
+            for term, keys in _CONTENT_TERM_KEYS.items():
+                # Terms whose sections are already found are not searched for
+                if not missing.isdisjoint(keys) and term in haystack:
+                    missing.difference_update(keys)
+                    if not missing:
+                        break
             
-            # If not in links, check visible text (less reliable but good fallback)
-            if not found:
-                 if any(term in text_content for term in terms):
-                    found = True
-            
-            audit[key] = found
-            
-        return audit
+        return {key: key not in missing for key in _CONTENT_KEYWORDS}
 
     def _find_emails(self, text: str) -> Set[str]:
         """Find email addresses in text."""
-        # Clean text slightly to avoid matching binary garbage if any
-        # Basic regex for email extraction
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        emails = set(re.findall(email_pattern, text))
+        emails = set(_EMAIL_RE.findall(text))
         
         # Filter out common false positives or image extensions
-        valid_emails = set()
-        for email in emails:
-            email_lower = email.lower()
-            if not any(ext in email_lower for ext in ['.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.js', '.css']):
-                 valid_emails.add(email)
-                 
-        return valid_emails
+        return {email for email in emails if not _ASSET_EXT_RE.search(email)}
     
     async def _find_decision_makers(self, base_url: str, client: httpx.AsyncClient) -> List[Dict[str, Any]]:
         """
@@ -244,11 +558,10 @@ class WebsiteScanner:
         for pattern in about_patterns:
             try:
                 about_url = base_domain + pattern
-                response = await client.get(about_url, timeout=10)
+                response, content = await self._fetch(client, about_url, timeout=10)
                 
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'lxml')
-                    found_makers = self._extract_decision_makers_from_page(soup)
+                if response.status_code == 200 and content and not _looks_binary(content):
+                    found_makers = await asyncio.to_thread(self._parse_decision_makers, content)
                     decision_makers.extend(found_makers)
                     
                     # Break after first successful page to avoid duplicates
@@ -261,6 +574,10 @@ class WebsiteScanner:
         unique_makers = self._deduplicate_decision_makers(decision_makers)
         return sorted(unique_makers, key=lambda x: x['confidence'], reverse=True)[:5]
     
+    def _parse_decision_makers(self, content: bytes) -> List[Dict[str, Any]]:
+        """Parse an about/team page and extract its decision makers (runs in a worker thread)."""
+        return self._extract_decision_makers_from_page(BeautifulSoup(content, 'lxml'))
+    
     def _extract_decision_makers_from_page(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """
         Extract decision maker names and titles from a page.
@@ -410,7 +727,15 @@ class WebsiteScanner:
             
         return summary.strip()
 
+# Shared scanner so successive scans reuse its connection pool
+_scanner = WebsiteScanner()
+
+
 # Standalone function for compatibility
 async def scan_website(url: str) -> WebsiteScanResult:
-    scanner = WebsiteScanner()
-    return await scanner.scan(url)
+    return await _scanner.scan(url)
+
+
+async def close_scanner() -> None:
+    """Close the shared scanner's HTTP client and cache (called on app shutdown)."""
+    await _scanner.aclose()
@@ -0,0 +1,51 @@
+import tempfile
+from datetime import date, datetime, time
+from pathlib import Path
+from openpyxl import Workbook
+from backend.modules import excel_handler
+from backend.modules.excel_handler import ExcelHandler
+
+
+def _workbook_with_second_sheet_active(path: Path):
+    wb = Workbook()
+    junk = wb.active
+    junk.title = "Notes"
+    junk.append(["junk"])
+    leads = wb.create_sheet("Leads")
+    leads.append(["Name", "Email", "Website", "Category", "City", "Signed Up", "Call At"])
+    leads.append(["Acme Roofing", "info@acme.com", "acme.com", "Roofing", "Austin", date(2024, 1, 1), time(9, 30)])
+    leads.append(["Bolt Electric", "hi@bolt.io", "bolt.io", "Electrical", "Denver", date(2024, 2, 15), time(14, 0)])
+    wb.active = 1
+    wb.save(path)
+
+
+def _load_leads(path: Path):
+    return [(lead.email, lead.extra_data) for lead in ExcelHandler(path).load()]
+
+
+def test_loads_active_sheet():
+    """Leads come from the workbook's active sheet, with identical values with or without python-calamine."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "leads.xlsx"
+        _workbook_with_second_sheet_active(path)
+        expected = [
+            ("info@acme.com", {"signed up": datetime(2024, 1, 1), "call at": time(9, 30)}),
+            ("hi@bolt.io", {"signed up": datetime(2024, 2, 15), "call at": time(14, 0)}),
+        ]
+
+        calamine = excel_handler.CalamineWorkbook
+        try:
+            excel_handler.CalamineWorkbook = None
+            assert _load_leads(path) == expected, "openpyxl path"
+        finally:
+            excel_handler.CalamineWorkbook = calamine
+
+        if calamine is not None:
+            assert _load_leads(path) == expected, "calamine path"
+        else:
+            print("python-calamine not installed; calamine path skipped")
+
+
+if __name__ == "__main__":
+    test_loads_active_sheet()
+    print("Excel active sheet test passed.")
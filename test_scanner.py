@@ -1,5 +1,22 @@
 import asyncio
-from backend.modules.website_scanner import scan_website
+from backend.modules.website_scanner import WebsiteScanner, scan_website
+
+
+def test_page_encodings():
+    """Pages are decoded per their Content-Type charset, then their <meta> charset, then UTF-8."""
+    scanner = WebsiteScanner(cache_file=None)
+    latin1 = (
+        '<html><head><meta charset="iso-8859-1"><title>Café Müller</title></head>'
+        '<body><h1>Grüße</h1></body></html>'
+    ).encode('latin-1')
+    utf8 = '<html><head><title>Café Müller</title></head><body><h1>Grüße</h1></body></html>'.encode('utf-8')
+    cases = [(latin1, None), (latin1, 'iso-8859-1'), (utf8, None), (utf8, 'utf-8')]
+    for content, charset in cases:
+        tech, _, _ = scanner._parse_and_audit(content, charset, "https://example.com/")
+        assert tech['title'] == 'Café Müller', (charset, tech['title'])
+        assert tech['h1'] == 'Grüße', (charset, tech['h1'])
+    print("Page encoding test passed.")
+
 
 async def main():
     urls = [
@@ -8,6 +25,7 @@ async def main():
         "https://github.com"
     ]
     
+    test_page_encodings()
     print("Starting scan test...")
     for url in urls:
         print(f"\nScanning {url}...")